@@ -5,6 +5,7 @@ from django.contrib.auth.admin import UserAdmin
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.urls import URLPattern, path, reverse
+from django.utils import timezone
 from rangefilter.filters import DateRangeQuickSelectListFilterBuilder
 
 from .models import (
@@ -129,4 +130,5 @@ class MonthlyChargeAdmin(admin.ModelAdmin):  # type: ignore [type-arg]
         self, request: HttpRequest, queryset: QuerySet[MonthlyCharge]
     ) -> None:
         """Update monthly charge status to 'Confirmed'."""
-        queryset.update(status="Confirmed")
+        # Bulk updates skip auto_now, so the change is recorded explicitly
+        queryset.update(status="Confirmed", updated_at=timezone.now())
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.7 on 2026-10-15 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0025_projectphase'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='capacity',
+            index=models.Index(fields=['start_date'], name='main_capaci_start_d_2b5196_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='funding',
+            index=models.Index(fields=['expiry_date'], name='main_fundin_expiry__cc3230_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monthlycharge',
+            index=models.Index(fields=['date'], name='main_monthl_date_4c07d0_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.7 on 2026-10-16 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0026_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='capacity',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, help_text='The date and time of the last change.', verbose_name='Last updated'),
+        ),
+        migrations.AddField(
+            model_name='funding',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, help_text='The date and time of the last change.', verbose_name='Last updated'),
+        ),
+        migrations.AddField(
+            model_name='monthlycharge',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, help_text='The date and time of the last change.', verbose_name='Last updated'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, help_text='The date and time of the last change.', verbose_name='Last updated'),
+        ),
+        migrations.AddField(
+            model_name='projectphase',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, help_text='The date and time of the last change.', verbose_name='Last updated'),
+        ),
+        migrations.AddField(
+            model_name='timeentry',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, help_text='The date and time of the last change.', verbose_name='Last updated'),
+        ),
+    ]
@@ -11,7 +11,7 @@ from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import Q, Sum
+from django.db.models import F, Q, Sum
 from django.utils import timezone
 
 from procat.settings.settings import (
@@ -97,6 +97,23 @@ class AnalysisCode(models.Model):
         return f"{self.code} - {self.description}"
 
 
+class ProjectQuerySet(models.QuerySet["Project"]):
+    """Custom queryset for the projects."""
+
+    def with_time_logged(self) -> ProjectQuerySet:
+        """Annotate the total time of the time entries, used by `days_left`.
+
+        Returns:
+            The queryset with the `time_logged` annotation.
+        """
+        return self.annotate(
+            time_logged=Sum(
+                F("timeentry__end_time") - F("timeentry__start_time"),
+                default=timedelta(),
+            )
+        )
+
+
 class Project(Warning, models.Model):
     """Software project details."""
 
@@ -197,17 +214,26 @@ class Project(Warning, models.Model):
         help_text="The ID of the project in Clockify, if applicable.",
     )
 
+    updated_at = models.DateTimeField(
+        "Last updated",
+        auto_now=True,
+        db_index=True,
+        help_text="The date and time of the last change.",
+    )
+
+    objects = ProjectQuerySet.as_manager()
+
     def __str__(self) -> str:
         """String representation of the Project object."""
         return self.name
 
-    def _warn_no_funding(self) -> None | str:
+    def _warn_no_funding(self) -> str | None:
         """Warns if there is no funding associated to the project."""
         if not self.funding_source.exists():
             return "No funding defined for the project."
         return None
 
-    def _warn_phase_lifetime(self) -> None | str:
+    def _warn_phase_lifetime(self) -> str | None:
         """Warns if the phases don't cover the project lifetime."""
         # get phases for project id
         phases_query = ProjectPhase.objects.filter(project__name=self.name)
@@ -234,7 +260,7 @@ class Project(Warning, models.Model):
             return "Phases do not span project lifetime."
         return None
 
-    def _warn_wrong_days_sum(self) -> None | str:
+    def _warn_wrong_days_sum(self) -> str | None:
         """Warns if the phases do not sum to the total working days for the project."""
         project_days = self.total_working_days
 
@@ -301,9 +327,8 @@ class Project(Warning, models.Model):
         Returns:
             The total number of days effort, or None if there is no funding information.
         """
-        if self.funding_source.exists():
-            total = sum([funding.effort for funding in self.funding_source.all()])
-            return total
+        if fundings := list(self.funding_source.all()):
+            return sum(funding.effort for funding in fundings)
 
         return None
 
@@ -315,12 +340,8 @@ class Project(Warning, models.Model):
             The total monetary amount of funding left, or none if there is no funding
             information.
         """
-        if self.funding_source.exists():
-            total = sum(
-                [funding.funding_left for funding in self.funding_source.all()],
-                Decimal(0),
-            )
-            return total
+        if fundings := list(self.funding_source.all()):
+            return sum((funding.funding_left for funding in fundings), Decimal(0))
 
         return None
 
@@ -339,17 +360,21 @@ class Project(Warning, models.Model):
     def days_left(self) -> tuple[float, float] | None:
         """Provide the days worth of effort left.
 
+        If the project was queried with `ProjectQuerySet.with_time_logged`, as in the
+        projects list, that total is used instead of querying the time entries again.
+
         Returns:
             The number of days and percentage worth of effort left, or None if there is
             no funding information.
         """
-        from .utils import get_logged_hours
-
-        if self.total_effort:
-            time_entries = self.timeentry_set.all()
-            hours_logged = get_logged_hours(time_entries)[0]
-            left = self.total_effort - (hours_logged / 7)
-            return round(left, 1), round(left / self.total_effort * 100, 1)
+        if total_effort := self.total_effort:
+            logged = getattr(self, "time_logged", None)
+            if logged is None:
+                logged = self.timeentry_set.aggregate(
+                    total=Sum(F("end_time") - F("start_time"), default=timedelta())
+                )["total"]
+            left = total_effort - (logged.total_seconds() / 3600 / 7)
+            return round(left, 1), round(left / total_effort * 100, 1)
 
         return None
 
@@ -427,8 +452,8 @@ class Project(Warning, models.Model):
         Returns:
             Float representing the estimated effort per day over project lifespan.
         """
-        if self.total_effort and self.total_working_days:
-            return self.total_effort / self.total_working_days
+        if (total_effort := self.total_effort) and self.total_working_days:
+            return total_effort / self.total_working_days
         return None
 
     def fte(self, timerange: pd.DatetimeIndex | None = None) -> pd.Series:  # type: ignore[explicit-any]
@@ -492,6 +517,24 @@ class Project(Warning, models.Model):
         return output
 
 
+class FundingQuerySet(models.QuerySet["Funding"]):
+    """Custom queryset for the funding."""
+
+    def with_funding_spent(self) -> FundingQuerySet:
+        """Annotate the total of the confirmed charges, used by `funding_left`.
+
+        Returns:
+            The queryset with the `funding_spent` annotation.
+        """
+        return self.annotate(
+            funding_spent=Sum(
+                "monthlycharge__amount",
+                filter=Q(monthlycharge__status="Confirmed"),
+                default=0,
+            )
+        )
+
+
 class Funding(models.Model):
     """Funding associated with a project."""
 
@@ -574,10 +617,20 @@ class Funding(models.Model):
         help_text="The current daily rate, which defaults to 389.00.",
     )
 
+    updated_at = models.DateTimeField(
+        "Last updated",
+        auto_now=True,
+        db_index=True,
+        help_text="The date and time of the last change.",
+    )
+
+    objects = FundingQuerySet.as_manager()
+
     class Meta:
         """Meta class for the model."""
 
         verbose_name_plural = "funding"
+        indexes = (models.Index(fields=["expiry_date"]),)
 
     def __str__(self) -> str:
         """String representation of the Funding object."""
@@ -647,14 +700,18 @@ class Funding(models.Model):
     def funding_left(self) -> Decimal:
         """Provide the funding left in currency.
 
-        Funding left is calculated based on 'Confirmed' monthly charges.
+        Funding left is calculated based on 'Confirmed' monthly charges. If the funding
+        was queried with `FundingQuerySet.with_funding_spent`, as in the funding list,
+        that total is used instead of querying the charges again.
 
         Returns:
             The amount of funding left.
         """
-        funding_spent = MonthlyCharge.objects.filter(
-            funding=self, status="Confirmed"
-        ).aggregate(Sum("amount"))["amount__sum"]
+        funding_spent = getattr(self, "funding_spent", None)
+        if funding_spent is None:
+            funding_spent = MonthlyCharge.objects.filter(
+                funding=self, status="Confirmed"
+            ).aggregate(Sum("amount"))["amount__sum"]
         if funding_spent:
             return self.budget - funding_spent
         return self.budget
@@ -733,10 +790,18 @@ class Capacity(models.Model):
         help_text="The date from when this capacity applies.",
     )
 
+    updated_at = models.DateTimeField(
+        "Last updated",
+        auto_now=True,
+        db_index=True,
+        help_text="The date and time of the last change.",
+    )
+
     class Meta:
         """Meta class for the model."""
 
         verbose_name_plural = "capacities"
+        indexes = (models.Index(fields=["start_date"]),)
 
     def __str__(self) -> str:
         """String representation of the Capacity object."""
@@ -800,6 +865,18 @@ class MonthlyCharge(models.Model):
         " monthly charges are not deleted.",
     )
 
+    updated_at = models.DateTimeField(
+        "Last updated",
+        auto_now=True,
+        db_index=True,
+        help_text="The date and time of the last change.",
+    )
+
+    class Meta:
+        """Meta class for the model."""
+
+        indexes = (models.Index(fields=["date"]),)
+
     def __str__(self) -> str:
         """String representation of the MonthlyCharge object."""
         return self.description
@@ -874,6 +951,13 @@ class TimeEntry(models.Model):
         help_text="The ID of the time entry in Clockify, if applicable.",
     )
 
+    updated_at = models.DateTimeField(
+        "Last updated",
+        auto_now=True,
+        db_index=True,
+        help_text="The date and time of the last change.",
+    )
+
     def __str__(self) -> str:
         """String representation of the Time Entry object."""
         return f"{self.user} - {self.project} - {self.start_time} to {self.end_time}"
@@ -977,6 +1061,13 @@ class ProjectPhase(FullTimeEquivalent):
         Project, related_name="phases", on_delete=models.PROTECT
     )
 
+    updated_at = models.DateTimeField(
+        "Last updated",
+        auto_now=True,
+        db_index=True,
+        help_text="The date and time of the last change.",
+    )
+
     def __str__(self) -> str:
         """String representation of the ProjectPhase object."""
         return f"{self.project.name} - {self.start_date} -> {self.end_date}"
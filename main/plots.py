@@ -21,7 +21,11 @@ from .utils import (
 
 
 def add_varea_glyph(
-    plot: figure, df: pd.DataFrame, upper_trace: str, lower_trace: str, colour: str
+    plot: figure,
+    source: ColumnDataSource,
+    upper_trace: str,
+    lower_trace: str,
+    colour: str,
 ) -> None:
     """Adds a varea glyph to add shading between traces.
 
@@ -30,22 +34,23 @@ def add_varea_glyph(
     the element-wise maximum of the two traces and the lower trace. Otherwise, the
     shading is applied whenever either trace is above the other.
 
+    The glyph uses the same data source as the traces, so the index and the lower
+    trace are not sent again to the browser; only the maximum is added as a column.
+
     Args:
         plot: the plot to add the glyph to
-        df: pandas DataFrame containing trace data
+        source: ColumnDataSource containing the index and trace data
         upper_trace: the label of the upper trace
         lower_trace: the label of the lower trace
         colour: the colour to apply to the shading
     """
-    source = ColumnDataSource(
-        {
-            "index": df["index"],
-            "y1": df[lower_trace],
-            "y2": df[upper_trace].combine(df[lower_trace], max),
-        }
-    )
+    upper = pd.Series(source.data[upper_trace])
+    lower = pd.Series(source.data[lower_trace])
+    maximum = f"max({upper_trace}, {lower_trace})"
+    source.add(upper.combine(lower, max).to_numpy(), maximum)  # type: ignore[arg-type]
     plot.add_glyph(
-        source, VArea(x="index", y1="y1", y2="y2", fill_color=colour, fill_alpha=0.3)
+        source,
+        VArea(x="index", y1=lower_trace, y2=maximum, fill_color=colour, fill_alpha=0.3),
     )
 
 
@@ -144,7 +149,7 @@ def create_timeseries_plot(  # type: ignore[explicit-any]
     # If provided, add varea shading between traces
     if vareas:
         for labels, colour in vareas:
-            add_varea_glyph(plot, df, labels[0], labels[1], colour)
+            add_varea_glyph(plot, source, labels[0], labels[1], colour)
 
     hover = HoverTool(
         tooltips=[
@@ -195,10 +200,10 @@ def create_capacity_planning_plot(
         ("Confirmed", "orange", ["Confirmed", "Active"]),
         ("Active", "navy", ["Active"]),
     )
-    for status, colour, filter in projects:
-        effort_timeseries = timeseries.get_effort_timeseries(
-            start_date, end_date, filter
-        )
+    efforts = timeseries.get_effort_timeseries_by_status(
+        start_date, end_date, [filter for _, _, filter in projects]
+    )
+    for (status, colour, _), effort_timeseries in zip(projects, efforts, strict=True):
         traces.append(
             {
                 "timeseries": effort_timeseries,
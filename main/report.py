@@ -3,12 +3,14 @@
 import csv
 import io
 from _csv import Writer
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta
+from itertools import chain
 from typing import cast
 
 from django.core.exceptions import ValidationError
 from django.db.models import QuerySet, Sum
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 
 from . import models, utils
@@ -150,18 +152,30 @@ def get_csv_charges_block(start_date: date) -> list[list[str]]:
     Returns:
         A list of lists representing rows in the csv for each charge.
     """
-    fields = [
+    return list(iter_csv_charges_block(start_date))
+
+
+def iter_csv_charges_block(start_date: date) -> Iterator[list[str]]:
+    """Iterate over the rows of the charges block for the CSV report.
+
+    The charges are retrieved from the database in chunks, so the whole block is not
+    held in memory at once.
+
+    Args:
+        start_date: starting date (1st of the  month) for the report period
+
+    Yields:
+        A list representing the row in the csv for each charge.
+    """
+    queryset = models.MonthlyCharge.objects.filter(date=start_date).values_list(
         "funding__cost_centre",
         "funding__activity",
         "funding__analysis_code__code",
         "amount",
         "description",
-    ]
-    queryset = models.MonthlyCharge.objects.filter(date=start_date).values(*fields)
-    charges_block = []
-    for record in queryset:
-        charges_block.append([str(record[field]) for field in fields])
-    return charges_block
+    )
+    for record in queryset.iterator(chunk_size=2000):
+        yield [str(value) for value in record]
 
 
 def get_csv_header_block(start_date: date) -> list[list[str]]:
@@ -251,13 +265,15 @@ def _get_projects_to_create_report_for(
     ).exclude(charging="Manual")
 
 
-def create_charges_report(month: int, year: int, writer: Writer) -> None:
-    """Generate the CSV report by creating Monthly Charge objects and writing to a CSV.
+def create_monthly_charges(month: int, year: int) -> date:
+    """Create the Monthly Charge objects for all the projects charged in a month.
 
     Args:
         month: month for the report date
         year: year for the report date
-        writer: csv.writer to create the CSV report as HttpResponse or StringIO
+
+    Returns:
+        The start date (1st of the month) of the report period.
     """
     # get the start_date and end dates (as the 1st of the month)
     start_date = date(year, month, 1)
@@ -281,31 +297,55 @@ def create_charges_report(month: int, year: int, writer: Writer) -> None:
         elif project.charging == "Actual":
             create_actual_monthly_charges(project, start_date, end_date)
 
+    return start_date
+
+
+def create_charges_report(month: int, year: int, writer: Writer) -> None:
+    """Generate the CSV report by creating Monthly Charge objects and writing to a CSV.
+
+    Args:
+        month: month for the report date
+        year: year for the report date
+        writer: csv.writer to create the CSV report as HttpResponse or StringIO
+    """
+    start_date = create_monthly_charges(month, year)
     header_block = get_csv_header_block(start_date)
     charges_block = get_csv_charges_block(start_date)
     write_to_csv(header_block, charges_block, writer)
 
 
-def create_charges_report_for_download(month: int, year: int) -> HttpResponse:
+class Echo:
+    """Pseudo-buffer that returns the written value instead of storing it."""
+
+    def write(self, value: str) -> str:
+        """Return the value passed, as written by the csv writer."""
+        return value
+
+
+def create_charges_report_for_download(month: int, year: int) -> StreamingHttpResponse:
     """Create the charges report as a HTTPResponse for download from the web app.
 
+    The monthly charges are created before the response is returned, but the CSV
+    rows are streamed as they are retrieved from the database.
+
     Args:
         month: month for the report date
         year: year for the report date
 
     Returns:
-        HttpResponse for the CSV report to download.
+        StreamingHttpResponse for the CSV report to download.
     """
-    response = HttpResponse(
+    start_date = create_monthly_charges(month, year)
+    rows = chain(get_csv_header_block(start_date), iter_csv_charges_block(start_date))
+    writer = csv.writer(Echo())
+    return StreamingHttpResponse(
+        (writer.writerow(row) for row in rows),
         content_type="text/csv",
         headers={
             "Content-Disposition": "attachment; "
             f"filename=charges_report_{month}-{year}.csv"
         },
     )
-    writer = csv.writer(response)
-    create_charges_report(month, year, writer)
-    return response
 
 
 def create_charges_report_for_attachment(month: int, year: int) -> str:
@@ -229,6 +229,7 @@ class FundingTable(tables.Table):
         """Meta class for the table."""
 
         model = Funding
+        order_by = ("expiry_date",)
         fields = (
             "project",
             "funding_body",
@@ -279,6 +280,7 @@ class ProjectPhaseTable(tables.Table):
         """Meta class for the table."""
 
         model = ProjectPhase
+        order_by = ("start_date",)
         fields = (
             "pk",
             "start_date",
@@ -298,6 +300,7 @@ class CapacityTable(tables.Table):
         """Meta class for the table."""
 
         model = Capacity
+        order_by = ("-start_date",)
         fields = (
             "user",
             "value",
@@ -319,5 +322,6 @@ class MonthlyChargeTable(tables.Table):
         """Meta class for the table."""
 
         model = MonthlyCharge
+        order_by = ("-date",)
         fields = ("date", "amount", "status", "description")
         attrs: ClassVar[dict[str, str]] = {"class": "table table-striped"}
@@ -79,7 +79,9 @@ def daily_project_status_check() -> None:
     """Daily task to check project statuses and notify leads."""
     from .models import Project
 
-    projects = Project.objects.filter(status="Active")
+    projects = Project.objects.filter(status="Active").prefetch_related(
+        "funding_source"
+    )
     for project in projects:
         project.check_and_notify_status()
 
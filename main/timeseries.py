@@ -90,6 +90,51 @@ def get_effort_timeseries(
     return cast("pd.Series[float]", timeseries)
 
 
+def get_effort_timeseries_by_status(
+    start_date: datetime, end_date: datetime, status_groups: list[list[str]]
+) -> list[pd.Series[float]]:
+    """Get the timeseries data for aggregated project effort for groups of statuses.
+
+    The effort of each project is calculated once, even if its status is in several
+    groups, and the aggregates for all the groups are obtained with a single matrix
+    product of the project efforts and the group membership of each project.
+
+    Args:
+        start_date: datetime object representing the start of the plotting period
+        end_date: datetime object representing the end of the plotting period
+        status_groups: a list with the project status values of each group (e.g.
+            [['Active', 'Confirmed'], ['Active']])
+
+    Returns:
+        A list with a Pandas series of aggregated effort, with date range as index,
+        for each group.
+    """
+    dates = pd.date_range(
+        pd.Timestamp(start_date.date()), pd.Timestamp(end_date.date()), tz=UTC
+    )
+
+    # filter Projects to ensure dates exist and overlap with timeseries dates
+    projects = list(
+        models.Project.objects.filter(
+            start_date__lt=end_date.date(),
+            end_date__gte=start_date.date(),
+            start_date__isnull=False,
+            end_date__isnull=False,
+            status__in={status for group in status_groups for status in group},
+        )
+    )
+    if not projects:
+        return [pd.Series(0.0, index=dates) for _ in status_groups]
+
+    effort = pd.concat([project.fte(dates) for project in projects], axis=1)
+    membership = pd.DataFrame(
+        [[project.status in group for group in status_groups] for project in projects],
+        dtype=float,
+    )
+    totals = effort.dot(membership)
+    return [totals[i].rename(None) for i in range(len(status_groups))]
+
+
 def get_internal_effort_timeseries(
     start_date: datetime, end_date: datetime
 ) -> pd.Series[float]:
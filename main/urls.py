@@ -72,6 +72,16 @@ urlpatterns = [
         views.CostRecoveryView.as_view(),
         name="cost_recovery",
     ),
+    path(
+        "capacity_planning/plot/",
+        views.CapacityPlanningPlotView.as_view(),
+        name="capacity_planning_plot",
+    ),
+    path(
+        "cost_recovery/plot/",
+        views.CostRecoveryPlotView.as_view(),
+        name="cost_recovery_plot",
+    ),
 ]
 
 if settings.DEBUG and not settings.USE_OIDC:
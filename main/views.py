@@ -1,14 +1,32 @@
 """Views for the main app."""
 
-from typing import Any
+import hashlib
+from collections import defaultdict
+from collections.abc import Callable
+from copy import deepcopy
+from functools import cache
+from typing import Any, ClassVar
 
 import bokeh
+from bokeh.embed import json_item
+from bokeh.models import LayoutDOM
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, permission_required
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.forms import Form, ModelForm
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.db.models import Count, Max, Model, Prefetch, QuerySet
+from django.forms import Form, ModelForm, modelform_factory
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.urls import reverse_lazy
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 from django.views.generic import (
     CreateView,
     DeleteView,
@@ -16,10 +34,13 @@ from django.views.generic import (
     ListView,
     TemplateView,
     UpdateView,
+    View,
 )
 from django_filters.views import FilterView
 from django_tables2 import RequestConfig, SingleTableMixin
 
+from procat.settings.settings import TABLE_ROWS_PER_PAGE
+
 from . import forms, models, plots, report, tables
 
 
@@ -42,26 +63,70 @@ class ProjectsListView(LoginRequiredMixin, FilterView):
     template_name = "main/projects.html"
     filterset_fields = ("nature", "department", "status", "charging")
 
+    def get_queryset(self) -> QuerySet[models.Project]:
+        """Restrict the columns retrieved to those needed by the project tables.
+
+        The funding sources are prefetched with their confirmed charges summed, as the
+        effort and funding columns of every row are calculated from them, and the time
+        logged is summed for the days left column.
+        """
+        return (
+            models.Project.objects.with_time_logged()
+            .select_related("department")
+            .prefetch_related(
+                Prefetch(
+                    "funding_source",
+                    queryset=models.Funding.objects.with_funding_spent(),
+                )
+            )
+            .only(
+                "name",
+                "nature",
+                "department",
+                "department__name",
+                "department__faculty",
+                "charging",
+                "status",
+                "start_date",
+                "end_date",
+            )
+            .order_by("name")
+        )
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore
-        """Add multiple pre-filtered tables to the context."""
+        """Add multiple pre-filtered tables to the context.
+
+        All projects are retrieved with a single query, ordered by name, and split by
+        status, so the tables need no sorting of their own. Only if a table is sorted,
+        its projects are queried separately, as some of the columns are sorted with
+        custom queryset ordering.
+        """
         context = super().get_context_data(**kwargs)
 
         base_qs = self.get_queryset()
+        projects_by_status: defaultdict[str, list[models.Project]] = defaultdict(list)
+        for project in base_qs:
+            projects_by_status[project.status].append(project)
 
         buckets = [
-            ("Active", {"status": "Active"}, "active-"),
-            ("Confirmed", {"status": "Confirmed"}, "confirmed-"),
-            ("Tentative", {"status": "Tentative"}, "tentative-"),
-            ("Finished", {"status": "Finished"}, "finished-"),
-            ("Not done", {"status": "Not done"}, "not-done-"),
+            ("Active", "active-"),
+            ("Confirmed", "confirmed-"),
+            ("Tentative", "tentative-"),
+            ("Finished", "finished-"),
+            ("Not done", "not-done-"),
         ]
 
+        config = RequestConfig(self.request, paginate={"per_page": TABLE_ROWS_PER_PAGE})
         created_tables: list[tuple[str, tables.ProjectTable]] = []
-        for title, filt, prefix in buckets:
-            qs = base_qs.filter(**filt)
-            tbl = tables.ProjectTable(qs, prefix=prefix)
-            RequestConfig(self.request).configure(tbl)
-            created_tables.append((title, tbl))
+        for status, prefix in buckets:
+            data: QuerySet[models.Project] | list[models.Project] = (
+                base_qs.filter(status=status)
+                if f"{prefix}sort" in self.request.GET
+                else projects_by_status[status]
+            )
+            tbl = tables.ProjectTable(data, prefix=prefix)
+            config.configure(tbl)
+            created_tables.append((status, tbl))
 
         context["tables"] = created_tables
         return context
@@ -81,6 +146,29 @@ class FundingListView(
     model = models.Funding
     table_class = tables.FundingTable
     template_name = "main/funding.html"
+    table_pagination: ClassVar[dict[str, int]] = {"per_page": TABLE_ROWS_PER_PAGE}
+
+    def get_queryset(self) -> QuerySet[models.Funding]:
+        """Restrict the columns retrieved to those needed by the funding table.
+
+        The confirmed charges are summed in the same query, so the funding and effort
+        left of each row do not need a query of their own.
+        """
+        return (
+            models.Funding.objects.with_funding_spent()
+            .select_related("project")
+            .only(
+                "project",
+                "project__name",
+                "source",
+                "funding_body",
+                "cost_centre",
+                "activity",
+                "expiry_date",
+                "budget",
+                "daily_rate",
+            )
+        )
 
 
 class CapacitiesListView(
@@ -94,8 +182,47 @@ class CapacitiesListView(
     model = models.Capacity
     table_class = tables.CapacityTable
     template_name = "main/capacities.html"
+    table_pagination: ClassVar[dict[str, int]] = {"per_page": TABLE_ROWS_PER_PAGE}
     filterset_fields = ("user",)
 
+    def get_queryset(self) -> QuerySet[models.Capacity]:
+        """Restrict the columns retrieved to those needed by the capacity table."""
+        return (
+            super()
+            .get_queryset()
+            .select_related("user")
+            .only("user", "user__first_name", "user__last_name", "value", "start_date")
+        )
+
+
+@cache
+def readonly_form_class(  # type: ignore[explicit-any]
+    model: type[Model],
+    form_class: type[ModelForm] | None,  # type: ignore[type-arg]
+    fields: Any,
+) -> type[ModelForm]:  # type: ignore[type-arg]
+    """Create a form class for a model with all of its widgets made read-only.
+
+    The class is created only once for each combination of arguments, so the widgets
+    are not modified every time a form is instantiated.
+
+    Args:
+        model: The model the form is associated to.
+        form_class: The form class to base the read-only form on, if any.
+        fields: The fields to include in the form, if no form class is given.
+
+    Return:
+        The read-only form class.
+    """
+    readonly = modelform_factory(model, form=form_class or ModelForm, fields=fields)
+    # declared fields are shared with the parent form, so they are copied first
+    readonly.base_fields = deepcopy(readonly.base_fields)
+    for field in readonly.base_fields.values():
+        field.widget.attrs["disabled"] = True
+        field.widget.attrs["readonly"] = True
+
+    return readonly
+
 
 class CustomBaseDetailView(LoginRequiredMixin, UpdateView):  # type: ignore [type-arg]
     """Detail view based on a read-only form view.
@@ -107,22 +234,26 @@ class CustomBaseDetailView(LoginRequiredMixin, UpdateView):  # type: ignore [typ
 
     fields = "__all__"
 
-    def get_form(self, form_class: Any | None = None) -> ModelForm:  # type: ignore
-        """Customize form to make it read-only.
+    def get_object(self, queryset: Any | None = None) -> Any:  # type: ignore
+        """Retrieve the object being displayed, querying the database only once.
 
         Args:
-            form_class: The form class to use, if any.
+            queryset: The queryset to retrieve the object from, if any.
 
         Return:
-            A form associated to the model.
+            The model instance associated to the view.
         """
-        form = super().get_form(form_class)
+        if not hasattr(self, "_cached_object"):
+            self._cached_object = super().get_object(queryset)
+        return self._cached_object
 
-        for field in form.fields.keys():
-            form.fields[field].widget.attrs["disabled"] = True
-            form.fields[field].widget.attrs["readonly"] = True
+    def get_form_class(self) -> type[ModelForm]:  # type: ignore
+        """Provide a read-only version of the form class.
 
-        return form
+        Return:
+            A form class associated to the model, with all the widgets disabled.
+        """
+        return readonly_form_class(self.model, self.form_class, self.fields)  # type: ignore[arg-type]
 
 
 class ProjectDetailView(PermissionRequiredMixin, CustomBaseDetailView):
@@ -142,17 +273,21 @@ class ProjectDetailView(PermissionRequiredMixin, CustomBaseDetailView):
         current project is displayed.
         """
         context = super().get_context_data(**kwargs)
-        context["project_name"] = self.get_object().name
+        project = self.object
+        context["project_name"] = project.name
         # get funding info for the current project
-        funding_source = self.get_object().funding_source.all()
-        funding_table = tables.FundingTable(funding_source)
-        project_phase = models.ProjectPhase.objects.filter(
-            project__name=self.get_object().name
-        )
-        phase_table = tables.ProjectPhaseTable(project_phase)
+        funding_source = project.funding_source.all()
+        funding_table = tables.FundingTable(funding_source, prefix="funding-")
+        # the reverse managers keep the project cached in each row, used by the links
+        project_phase = project.phases.all()
+        phase_table = tables.ProjectPhaseTable(project_phase, prefix="phase-")
         # enables the table to be sorted by column headings
-        RequestConfig(self.request).configure(funding_table)
-        RequestConfig(self.request).configure(phase_table)
+        RequestConfig(
+            self.request, paginate={"per_page": TABLE_ROWS_PER_PAGE}
+        ).configure(funding_table)
+        RequestConfig(
+            self.request, paginate={"per_page": TABLE_ROWS_PER_PAGE}
+        ).configure(phase_table)
 
         context["funding_table"] = funding_table
         context["phase_table"] = phase_table
@@ -167,33 +302,101 @@ class FundingDetailView(PermissionRequiredMixin, CustomBaseDetailView):
     permission_required = "main.view_funding"
     raise_exception = False
 
+    def get_queryset(self) -> QuerySet[models.Funding]:
+        """Retrieve the project together with the funding, as needed for its name."""
+        return super().get_queryset().select_related("project")
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore
         """Add funding name to the context, so it is easy to retrieve."""
         context = super().get_context_data(**kwargs)
-        funding = self.get_object()
+        funding = self.object
         context["funding_name"] = str(funding)
 
-        # Monthly charges table for this funding
-        charges_qs = models.MonthlyCharge.objects.filter(funding=funding).order_by(
-            "-date"
+        # Monthly charges table for this funding, as plain rows rather than instances
+        charges_qs = (
+            models.MonthlyCharge.objects.filter(funding=funding)
+            .values("date", "amount", "status", "description")
+            .order_by("-date")
         )
         charges_table = tables.MonthlyChargeTable(charges_qs)
-        RequestConfig(self.request).configure(charges_table)
+        RequestConfig(
+            self.request, paginate={"per_page": TABLE_ROWS_PER_PAGE}
+        ).configure(charges_table)
         context["monthly_charges_table"] = charges_table
 
         return context
 
 
+# Models whose changes invalidate the plots, all tracking their last change
+PLOTTED_MODELS: tuple[type[Model], ...] = (
+    models.Project,
+    models.Funding,
+    models.ProjectPhase,
+    models.Capacity,
+    models.MonthlyCharge,
+    models.TimeEntry,
+)
+
+
+def plots_etag(request: HttpRequest) -> str:
+    """Provide an ETag for the plots of the whole database.
+
+    The ETag is a hash of the time of the latest change and the number of rows of
+    each of the models feeding the plots, the latter accounting for deletions. The
+    current date is included too, as the plots are relative to today.
+
+    Args:
+        request: The HTTP request object.
+
+    Returns:
+        The hexadecimal digest identifying the version of the data.
+    """
+    fingerprint = hashlib.md5(usedforsecurity=False)
+    fingerprint.update(str(timezone.now().date()).encode())
+    for model in PLOTTED_MODELS:
+        summary = model._default_manager.aggregate(Count("pk"), Max("updated_at"))
+        fingerprint.update(repr(sorted(summary.items())).encode())
+    return fingerprint.hexdigest()
+
+
+@method_decorator(
+    [cache_control(private=True, no_cache=True), etag(plots_etag)], name="get"
+)
+class PlotView(LoginRequiredMixin, View):
+    """Base view that provides a Bokeh layout as JSON, to be embedded by a page.
+
+    Building the plots is slow, so the pages are rendered without them and fetch
+    them separately once loaded. Subclasses must set the function creating the
+    layout as `layout_factory`.
+    """
+
+    layout_factory: Callable[[], LayoutDOM]
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        """Provide the layout serialised as a JSON item."""
+        return JsonResponse(json_item(self.layout_factory()))
+
+
+class CapacityPlanningPlotView(PlotView):
+    """View that provides the plots of the Capacity Planning page."""
+
+    layout_factory = staticmethod(plots.create_capacity_planning_layout)
+
+
+class CostRecoveryPlotView(PlotView):
+    """View that provides the plots of the Cost Recovery page."""
+
+    layout_factory = staticmethod(plots.create_cost_recovery_layout)
+
+
 class CapacityPlanningView(LoginRequiredMixin, TemplateView):
     """View that renders the Capacity Planning page."""
 
     template_name = "main/capacity_planning.html"
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore
-        """Add HTML components and Bokeh version to the context."""
+        """Add the Bokeh version to the context."""
         context = super().get_context_data(**kwargs)
-        layout = plots.create_capacity_planning_layout()
-        context.update(plots.html_components_from_plot(layout))
         context["bokeh_version"] = bokeh.__version__
         return context
 
@@ -204,7 +407,7 @@ class CostRecoveryView(LoginRequiredMixin, FormView):  # type: ignore [type-arg]
     template_name = "main/cost_recovery.html"
     form_class = forms.CostRecoveryForm
 
-    def form_valid(self, form: Form) -> HttpResponse:
+    def form_valid(self, form: Form) -> StreamingHttpResponse:  # type: ignore[override]
         """Generate csv using the dates provided in the form."""
         month = form.cleaned_data["month"]
         year = form.cleaned_data["year"]
@@ -212,11 +415,14 @@ class CostRecoveryView(LoginRequiredMixin, FormView):  # type: ignore [type-arg]
         return response
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore
-        """Add HTML components and Bokeh version to the context."""
+        """Add the Bokeh version and whether to preview the plots to the context.
+
+        The page is mostly used to download the charges report, so the plots are
+        only loaded when requested with the `preview` query parameter.
+        """
         context = super().get_context_data(**kwargs)
-        layout = plots.create_cost_recovery_layout()
-        context.update(plots.html_components_from_plot(layout))
         context["bokeh_version"] = bokeh.__version__
+        context["preview"] = "preview" in self.request.GET
         return context
 
 
@@ -338,6 +544,10 @@ class ProjectPhaseDetailView(PermissionRequiredMixin, CustomBaseDetailView):
     permission_required = "main.view_project_phase"
     raise_exception = False
 
+    def get_queryset(self) -> QuerySet[models.ProjectPhase]:
+        """Retrieve the project together with the phase, as needed for its name."""
+        return super().get_queryset().select_related("project")
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore
         """Add project name and funding table to the context.
 
@@ -345,7 +555,7 @@ class ProjectPhaseDetailView(PermissionRequiredMixin, CustomBaseDetailView):
         current project is displayed.
         """
         context = super().get_context_data(**kwargs)
-        context["project_name"] = self.get_object().project.name
+        context["project_name"] = self.object.project.name
 
         return context
 
@@ -46,10 +46,15 @@ def add_timeseries_callback_to_date_pickers(
         args=dict(
             start_picker=start_picker, end_picker=end_picker, x_range=plot.x_range
         ),
-        code="""const start = Date.parse(start_picker.value);
-            const end = Date.parse(end_picker.value);
-            x_range.start = start
-            x_range.end = end""",
+        code="""function toTimestamp(value) {
+                // Picker values are ISO dates, parsed without Date.parse
+                const year = +value.slice(0, 4);
+                const month = value.slice(5, 7) - 1;
+                return Date.UTC(year, month, +value.slice(8, 10));
+            }
+
+            x_range.start = toTimestamp(start_picker.value);
+            x_range.end = toTimestamp(end_picker.value);""",
     )  # x_range in the plot is updated with dates parsed from the date pickers
     start_picker.js_on_change("value", callback)
     end_picker.js_on_change("value", callback)
@@ -65,9 +70,11 @@ def add_bar_callback_to_date_pickers(
 
     As the x-range is categorical, we supply the list of formatted chart_months, index
     the list using the dates selected in the date pickers, and use the indexed list to
-    update x_range.factors. '(window.skip_bar_picker_callback)' is used to prevent
-    interference when the plot is updated using the buttons (otherwise when the buttons
-    update the date pickers, this callback is also run).
+    update x_range.factors. The index of each month is looked up by the year and month
+    of the picker value ('YYYY-MM'), precomputed here, rather than searched and
+    formatted in JS. The update is scheduled for the next animation frame, so when both
+    pickers change together (e.g. when updated by the buttons) the plot is only
+    updated once, with the final values of both pickers.
 
     Args:
         start_picker: The start date picker to add the callback to
@@ -75,6 +82,11 @@ def add_bar_callback_to_date_pickers(
         plot: The plot modified by the date pickers
         chart_months: list of months for x-axis in bar chart
     """
+    month_index = {
+        datetime.strptime(month, "%b %Y").strftime("%Y-%m"): i
+        for i, month in enumerate(chart_months)
+    }
+
     # JS code dictates what happens when a new date is selected on the pickers
     callback = CustomJS(
         args=dict(
@@ -82,25 +94,20 @@ def add_bar_callback_to_date_pickers(
             end_picker=end_picker,
             plot=plot,
             months=chart_months,
+            month_index=month_index,
         ),
-        code="""if (window.skip_bar_picker_callback) {
-            window.skip_bar_picker_callback = false;
+        code="""if (plot.bar_picker_frame) {
             return;
         }
 
-        function getIndex(picker_value) {
-            const date = new Date(picker_value);
-            const month = date.toLocaleString('default', { month: 'short' });
-            const year = date.getFullYear();
-            const formatted_month = `${month} ${year}`;
-            return months.indexOf(formatted_month);
-        }
-
-        const start_index = getIndex(start_picker.value);
-        const end_index = getIndex(end_picker.value);
-        const selected_months = months.slice(start_index, end_index + 1);
+        plot.bar_picker_frame = requestAnimationFrame(() => {
+            plot.bar_picker_frame = null;
+            const start_index = month_index[start_picker.value.slice(0, 7)];
+            const end_index = month_index[end_picker.value.slice(0, 7)];
+            const selected_months = months.slice(start_index, end_index + 1);
 
-        plot.x_range.factors = selected_months;""",
+            plot.x_range.factors = selected_months;
+        });""",
     )  # x_range in the plot is updated with dates parsed from the date pickers
 
     start_picker.js_on_change("change", callback)
@@ -198,10 +205,11 @@ def add_bar_callback_to_button(
     plot: figure,
     chart_months: list[str],
 ) -> None:
-    """Add the JS callback to a button to update a plot x_range and picker dates.
+    """Add the JS callback to a button to update a bar plot x_range.
 
-    'window.skip_bar_picker_callback = true' is used to prevent the callback in
-    add_bar_callback_to_date_pickers from being run concurrently.
+    If the button also updates the date pickers, the callback in
+    add_bar_callback_to_date_pickers then sets the same months in the next animation
+    frame.
 
     Args:
         button: The button to add the callback to
@@ -226,7 +234,6 @@ def add_bar_callback_to_button(
                 indexed_months=indexed_months,
                 plot=plot,
             ),
-            code="""window.skip_bar_picker_callback = true;
-            plot.x_range.factors = indexed_months;""",
+            code="""plot.x_range.factors = indexed_months;""",
         )  # x_range in plot updated
     )
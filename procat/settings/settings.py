@@ -163,6 +163,7 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 WORKING_DAYS = 220  # Number of working days per year
 EFFORT_LEFT_THRESHOLD = [50, 30, 10, 0]  # Thresholds for effort left (percent)
 WEEKS_LEFT_THRESHOLD = [50, 30, 10, 0]  # Thresholds for weeks left (percent)
+TABLE_ROWS_PER_PAGE = 50  # Number of rows queried and displayed per table page
 CLOCKIFY_API_KEY = os.environ.get("CLOCKIFY_API_KEY")
 CLOCKIFY_WORKSPACE_ID = os.environ.get("CLOCKIFY_WORKSPACE_ID")
 
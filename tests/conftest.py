@@ -1,12 +1,23 @@
 """Pytest configuration file."""
 
 from datetime import datetime, timedelta
+from decimal import Decimal
+from importlib import import_module
 
 import pytest
 from django.contrib.auth import get_user_model
 from django.test import Client
 from django.utils import timezone
 
+from main import models
+
+
+def pytest_configure(config):
+    """Use a fast password hasher, as the passwords in tests need not be secure."""
+    from django.conf import settings
+
+    settings.PASSWORD_HASHERS = ("django.contrib.auth.hashers.MD5PasswordHasher",)
+
 
 @pytest.fixture(autouse=True)
 def use_model_backend(settings):
@@ -15,103 +26,135 @@ def use_model_backend(settings):
     settings.LOGIN_URL = "/accounts/login/"
 
 
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Create the objects shared by most tests once for the whole session.
+
+    Creating a user is slow, as its password is hashed, so the default user and
+    department are added to the test database once. Each test still runs within a
+    transaction that is rolled back, so changes made to them do not leak to others.
+    """
+    with django_db_blocker.unblock():
+        get_user_model().objects.create_user(
+            first_name="test",
+            last_name="user",
+            email="test.user@mail.com",
+            password="1234",
+            username="testuser",
+        )
+        models.Department.objects.create(name="ICT", faculty="Other")
+
+
 @pytest.fixture
 def user(django_user_model):
     """Provides a Django user with predefined attributes."""
-    return django_user_model.objects.create_user(
-        first_name="test",
-        last_name="user",
-        email="test.user@mail.com",
-        password="1234",
-        username="testuser",
-    )
+    return django_user_model.objects.get(username="testuser")
+
+
+@pytest.fixture(scope="session")
+def user_session_key(django_db_setup, django_db_blocker) -> str:
+    """Provides the key of a session with the default user logged in.
+
+    The session is created once for the whole session, rather than logging in the
+    user for every test.
+    """
+    from django.conf import settings
+    from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+
+    engine = import_module(settings.SESSION_ENGINE)
+    with django_db_blocker.unblock():
+        user = get_user_model().objects.get(username="testuser")
+        session = engine.SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+    return session.session_key
 
 
 @pytest.fixture
-def auth_client(user) -> Client:
+def auth_client(db, user_session_key, settings) -> Client:
     """Return an authenticated client."""
     client = Client()
-    client.force_login(user)
+    client.cookies[settings.SESSION_COOKIE_NAME] = user_session_key
     return client
 
 
+@pytest.fixture
+def today():
+    """Provides today's date, read once so all of a test's objects agree on it."""
+    return timezone.now().date()
+
+
 @pytest.fixture
 def department():
     """Provides a default department object."""
-    from main import models
-
-    return models.Department.objects.get_or_create(name="ICT", faculty="Other")[0]
+    return models.Department.objects.get(name="ICT")
 
 
 @pytest.fixture
-def project(user, department):
+def project(user, department, today):
     """Provides a default project object."""
-    from main import models
-
-    return models.Project.objects.get_or_create(
+    return models.Project.objects.create(
         name="ProCAT",
         department=department,
         lead=user,
-        start_date=timezone.now().date(),
-        end_date=timezone.now().date() + timedelta(days=42),
+        start_date=today,
+        end_date=today + timedelta(days=42),
         status="Active",
-    )[0]
+    )
 
 
 @pytest.fixture
-def project_mid(user, department, analysis_code):
+def project_mid(user, department, analysis_code, today):
     """Provides a project object halfway through it lifetime."""
-    from main import models
-
-    project = models.Project.objects.get_or_create(
+    project = models.Project.objects.create(
         name="ProCAT",
         department=department,
         lead=user,
-        start_date=timezone.now().date() - timedelta(days=42),
-        end_date=timezone.now().date() + timedelta(days=42),
+        start_date=today - timedelta(days=42),
+        end_date=today + timedelta(days=42),
         status="Active",
-    )[0]
+    )
 
-    _ = models.Funding.objects.get_or_create(
+    _ = models.Funding.objects.create(
         project=project,
         source="External",
         funding_body="Funding body",
         cost_centre="centre",
         activity="G12345",
         analysis_code=analysis_code,
-        expiry_date=timezone.now().date() + timedelta(days=42),
+        expiry_date=today + timedelta(days=42),
         budget=10000.00,
         daily_rate=389.00,
-    )[0]
+    )
 
     return project
 
 
 @pytest.fixture
-def project_static(user, department, analysis_code):
+def project_static(user, department, analysis_code, today):
     """Provides a statically dated project object with funding."""
-    from main import models
-
-    project = models.Project.objects.get_or_create(
+    project = models.Project.objects.create(
         name="ProCATv2",
         department=department,
         lead=user,
         start_date=datetime(2025, 1, 1).date(),
         end_date=datetime(2027, 6, 30).date(),
         status="Active",
-    )[0]
+    )
 
-    _ = models.Funding.objects.get_or_create(
+    _ = models.Funding.objects.create(
         project=project,
         source="External",
         funding_body="Funding body",
         cost_centre="centre",
         activity="G12345",
         analysis_code=analysis_code,
-        expiry_date=timezone.now().date() + timedelta(days=42),
+        expiry_date=today + timedelta(days=42),
         budget=10000.00,
         daily_rate=389.00,
-    )[0]
+    )
 
     return project
 
@@ -119,63 +162,97 @@ def project_static(user, department, analysis_code):
 @pytest.fixture
 def analysis_code():
     """Provides a default analysis code object."""
-    from main import models
-
-    return models.AnalysisCode.objects.get_or_create(
+    return models.AnalysisCode.objects.create(
         code="1234", description="Some code", notes="None"
-    )[0]
+    )
 
 
 @pytest.fixture
-def funding(project, analysis_code):
+def funding(project, analysis_code, today):
     """Provides a default funding object."""
-    from main import models
-
-    return models.Funding.objects.get_or_create(
+    return models.Funding.objects.create(
         project=project,
         source="External",
         funding_body="Funding body",
         cost_centre="centre",
         activity="G12345",
         analysis_code=analysis_code,
-        expiry_date=timezone.now().date() + timedelta(days=42),
-        budget=10000.00,
-        daily_rate=389.00,
-    )[0]
+        expiry_date=today + timedelta(days=42),
+        budget=Decimal("10000.00"),
+        daily_rate=Decimal("389.00"),
+    )
 
 
 @pytest.fixture
-def capacity(user):
-    """Provides a default capacity object."""
-    from main import models
+def confirmed_charge(project, funding):
+    """Provides a confirmed monthly charge, alongside an uncounted draft one."""
+    charge_date = funding.expiry_date - timedelta(days=5)
+    models.MonthlyCharge.objects.create(
+        project=project,
+        funding=funding,
+        amount=Decimal("200.00"),
+        date=charge_date,
+        status="Draft",
+    )
+    return models.MonthlyCharge.objects.create(
+        project=project,
+        funding=funding,
+        amount=Decimal("100.00"),
+        date=charge_date,
+        status="Confirmed",
+    )
+
 
-    return models.Capacity.objects.get_or_create(
+@pytest.fixture
+def make_funding(project, analysis_code, today):
+    """Provides a factory of complete, unsaved funding objects for the project.
+
+    Keyword arguments override the default field values.
+    """
+
+    def _make_funding(**kwargs) -> models.Funding:
+        fields = dict(
+            project=project,
+            source="External",
+            funding_body="EPSRC",
+            cost_centre="centre",
+            activity="G12345",
+            analysis_code=analysis_code,
+            expiry_date=today,
+            budget=1000.00,
+            daily_rate=389.00,
+        )
+        return models.Funding(**(fields | kwargs))
+
+    return _make_funding
+
+
+@pytest.fixture
+def capacity(user, today):
+    """Provides a default capacity object."""
+    return models.Capacity.objects.create(
         user=user,
         value=0.7,
-        start_date=timezone.now().date(),
+        start_date=today,
     )
 
 
 @pytest.fixture
 def phase(project_static):
     """Provides a default ProjectPhase object alongside others."""
-    from main import models
-
-    models.ProjectPhase.objects.get_or_create(
+    models.ProjectPhase.objects.create(
         project=project_static,
         value=1,
         start_date=datetime(2027, 4, 10).date(),
         end_date=datetime(2027, 6, 30).date(),
     )
 
-    models.Funding.objects.get_or_create(project=project_static)
-
-    return models.ProjectPhase.objects.get_or_create(
+    return models.ProjectPhase.objects.create(
         project=project_static,
         value=1,
         start_date=datetime(2027, 2, 10).date(),
         end_date=datetime(2027, 3, 9).date(),
-    )[0]
+    )
 
 
 @pytest.fixture
@@ -1,11 +1,34 @@
 """Tests for the Clockify API interface."""
 
 import json
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import pytest
 import requests
 
+REPORTS_URL = (
+    "https://reports.api.clockify.me/v1/workspaces/test_workspace_id/reports/detailed"
+)
+PAYLOAD = {
+    "dateRangeStart": "2024-09-01T00:00:00.000Z",
+    "dateRangeEnd": "2025-01-01T23:59:59.000Z",
+    "detailedFilter": {"page": 1, "pageSize": 200},
+}
+
+
+@pytest.fixture
+def mock_request(mocker):
+    """Patch the requests sent by the Clockify API."""
+    return mocker.patch("main.Clockify.api_interface.requests.request")
+
+
+@pytest.fixture(scope="module")
+def clockify_api():
+    """Provides a ClockifyAPI instance, shared as it is not modified by the requests."""
+    from main.Clockify.api_interface import ClockifyAPI
+
+    return ClockifyAPI("test_api_key", "test_workspace_id")
+
 
 class TestClockifyAPI:
     """Test suite for the ClockifyAPI class."""
@@ -23,98 +46,55 @@ class TestClockifyAPI:
         assert api.reports_base_url == "https://reports.api.clockify.me/v1"
         assert api.headers == {"Content-Type": "application/json", "X-Api-Key": api_key}
 
-    @patch("main.Clockify.api_interface.requests.request")
-    def test_get_time_entries_success(self, mock_request):
-        """Test successful API call to get time entries."""
-        from main.Clockify.api_interface import ClockifyAPI
+    @pytest.mark.parametrize(
+        ["payload", "time_entries"],
+        [
+            [
+                PAYLOAD,
+                [
+                    {
+                        "_id": "670763ed716e763b41ba5665",
+                        "description": "",
+                        "userId": "5e57c79e0121f031bdc4be8d",
+                        "timeInterval": {
+                            "start": "2024-10-10T06:19:41+01:00",
+                            "end": "2024-10-10T07:30:41+01:00",
+                            "duration": 4260,
+                        },
+                        "billable": True,
+                        "projectId": "6694bb8babec074beb0731cb",
+                    }
+                ],
+            ],
+            [{}, []],
+        ],
+        ids=["Time entries", "Empty payload"],
+    )
+    def test_get_time_entries(self, clockify_api, mock_request, payload, time_entries):
+        """Test successful API calls to get time entries."""
+        mock_request.return_value = SimpleNamespace(
+            status_code=200, json=lambda: {"timeentries": time_entries}
+        )
 
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "timeentries": [
-                {
-                    "_id": "670763ed716e763b41ba5665",
-                    "description": "",
-                    "userId": "5e57c79e0121f031bdc4be8d",
-                    "timeInterval": {
-                        "start": "2024-10-10T06:19:41+01:00",
-                        "end": "2024-10-10T07:30:41+01:00",
-                        "duration": 4260,
-                    },
-                    "billable": True,
-                    "projectId": "6694bb8babec074beb0731cb",
-                }
-            ]
-        }
-        mock_request.return_value = mock_response
-
-        api = ClockifyAPI("test_api_key", "test_workspace_id")
-        payload = {
-            "dateRangeStart": "2024-09-01T00:00:00.000Z",
-            "dateRangeEnd": "2025-01-01T23:59:59.000Z",
-            "detailedFilter": {"page": 1, "pageSize": 200},
-        }
-
-        result = api.get_time_entries(payload)
+        result = clockify_api.get_time_entries(payload)
 
         mock_request.assert_called_once()
         call_args = mock_request.call_args
         assert call_args[0][0] == "POST"
-        assert (
-            call_args[0][1]
-            == "https://reports.api.clockify.me/v1/workspaces/test_workspace_id/reports/detailed"
-        )
+        assert call_args[0][1] == REPORTS_URL
         assert call_args[1]["headers"]["x-api-key"] == "test_api_key"
         assert call_args[1]["headers"]["Content-Type"] == "application/json"
+        assert call_args[1]["data"] == json.dumps(payload)
 
-        sent_payload = json.loads(call_args[1]["data"])
-        assert sent_payload == payload
-
-        assert result == mock_response.json.return_value
-        assert "timeentries" in result
-        assert len(result["timeentries"]) == 1
+        assert result == {"timeentries": time_entries}
 
-    @patch("main.Clockify.api_interface.requests.request")
-    def test_get_time_entries_http_error(self, mock_request):
+    def test_get_time_entries_http_error(self, clockify_api, mock_request):
         """Test API call with HTTP error response."""
-        from main.Clockify.api_interface import ClockifyAPI
-
-        mock_response = Mock()
+        mock_response = mock_request.return_value
         mock_response.status_code = 401
         mock_response.raise_for_status.side_effect = requests.HTTPError("Unauthorized")
-        mock_request.return_value = mock_response
-
-        api = ClockifyAPI("invalid_api_key", "test_workspace_id")
-        payload = {"dateRangeStart": "2024-09-01T00:00:00.000Z"}
 
         with pytest.raises(requests.HTTPError, match=r"Unauthorized"):
-            api.get_time_entries(payload)
+            clockify_api.get_time_entries(PAYLOAD)
 
         mock_response.raise_for_status.assert_called_once()
-
-    @patch("main.Clockify.api_interface.requests.request")
-    def test_get_time_entries_empty_payload(self, mock_request):
-        """Test API call with empty payload."""
-        from main.Clockify.api_interface import ClockifyAPI
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"timeentries": []}
-        mock_request.return_value = mock_response
-
-        api = ClockifyAPI("test_api_key", "test_workspace_id")
-        payload = {}
-
-        result = api.get_time_entries(payload)
-
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        assert call_args[0][0] == "POST"
-        assert "test_workspace_id" in call_args[0][1]
-        assert call_args[1]["headers"]["x-api-key"] == "test_api_key"
-
-        sent_payload = json.loads(call_args[1]["data"])
-        assert sent_payload == {}
-
-        assert result == {"timeentries": []}
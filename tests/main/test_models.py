@@ -2,27 +2,36 @@
 
 from contextlib import nullcontext as does_not_raise
 from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
 
 import pandas as pd
 import pytest
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
+from main import models
 
-def test_department_model_str():
-    """Test the object string for the model."""
-    from main import models
+TODAY = timezone.now().date()
 
-    dep = models.Department(name="ICT", faculty="Other")
-    assert str(dep) == "ICT - Other"
 
-
-def test_analysis_code_model_str():
-    """Test the object string for the model."""
-    from main import models
-
-    dep = models.AnalysisCode(code="1234", description="Some code", notes="None")
-    assert str(dep) == "1234 - Some code"
+@pytest.mark.parametrize(
+    "instance, expected",
+    [
+        pytest.param(
+            models.Department(name="ICT", faculty="Other"),
+            "ICT - Other",
+            id="department",
+        ),
+        pytest.param(
+            models.AnalysisCode(code="1234", description="Some code", notes="None"),
+            "1234 - Some code",
+            id="analysis code",
+        ),
+    ],
+)
+def test_simple_model_str(instance, expected):
+    """Test the object string for the models."""
+    assert str(instance) == expected
 
 
 class TestProject:
@@ -30,66 +39,56 @@ class TestProject:
 
     def test_model_str(self):
         """Test the object string for the model."""
-        from main import models
-
         project = models.Project(name="ProCAT")
         assert str(project) == "ProCAT"
 
     def test_clean_when_tentative(self):
         """Test the clean method."""
-        from main import models
-
         project = models.Project(name="ProCAT")
         project.clean()
 
-    def test_clean_when_not_tentative(self, user):
+    @pytest.mark.parametrize(
+        ["dates", "messages"],
+        [
+            pytest.param(
+                None,
+                [
+                    "All fields are mandatory except if Project status is 'Tentative'"
+                    " or 'Not done'."
+                ],
+                id="Missing fields",
+            ),
+            pytest.param(
+                (TODAY, TODAY),
+                ["The end date must be after the start date."],
+                id="End date not after start date",
+            ),
+            pytest.param((TODAY, TODAY + timedelta(days=42)), [], id="Valid"),
+        ],
+    )
+    def test_clean_when_not_tentative(self, user, dates, messages):
         """Test the clean method."""
-        from main import models
-
-        # Mandatory fields are present
         project = models.Project(name="ProCAT", status="Finished")
-        with pytest.raises(
-            ValidationError,
-            match=r"All fields are mandatory except if Project status is 'Tentative'"
-            " or 'Not done'.",
-        ):
-            project.clean()
-
-        # The end date is after the start date
-        project = models.Project(
-            name="ProCAT",
-            lead=user,
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date(),
-            status="Finished",
-        )
-        with pytest.raises(
-            ValidationError,
-            match=r"The end date must be after the start date.",
-        ):
+        if dates:
+            project.lead = user
+            project.start_date, project.end_date = dates
+
+        if messages:
+            with pytest.raises(ValidationError) as e:
+                project.clean()
+            assert e.value.messages == messages
+        else:
             project.clean()
 
-        # All good!
-        project = models.Project(
-            name="ProCAT",
-            lead=user,
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date() + timedelta(days=42),
-            status="Finished",
-        )
-        project.clean()
-
-    def test_clean_when_project_active(self, user, department):
+    def test_clean_when_project_active(self, user, department, today):
         """Test the clean method."""
-        from main import models
-
         # All good, the project is tentative.
         project = models.Project(
             name="ProCAT",
             lead=user,
             department=department,
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date() + timedelta(days=42),
+            start_date=today,
+            end_date=today + timedelta(days=42),
             status="Tentative",
         )
         project.clean()
@@ -100,23 +99,23 @@ class TestProject:
 
         # No funding, no active
         project.save()
-        with pytest.raises(
-            ValidationError,
-            match=r"Active and Confirmed projects must have at least 1 funding source.",
-        ):
+        with pytest.raises(ValidationError) as e:
             project.clean()
+        assert e.value.messages == [
+            "Active and Confirmed projects must have at least 1 funding source."
+        ]
 
         # Add funding source, but it is incomplete, so still fails
-        funding, _ = models.Funding.objects.get_or_create(
+        funding = models.Funding.objects.create(
             project=project,
             source="External",
             budget=10000.00,
         )
-        with pytest.raises(
-            ValidationError,
-            match=r"Funding of Active and Confirmed projects must be complete.",
-        ):
+        with pytest.raises(ValidationError) as e:
             project.clean()
+        assert e.value.messages == [
+            "Funding of Active and Confirmed projects must be complete."
+        ]
 
         # Now things work, as the above is enough for an internal source to be complete
         funding.source = "Internal"
@@ -127,34 +126,29 @@ class TestProject:
         ["status", "start_date", "end_date", "output"],
         [
             ["Tentative", None, None, None],
-            ["Confirmed", timezone.now().date(), None, None],
-            ["Confirmed", None, timezone.now().date(), None],
-            ["Tentative", timezone.now().date(), timezone.now().date(), None],
+            ["Confirmed", TODAY, None, None],
+            ["Confirmed", None, TODAY, None],
+            ["Tentative", TODAY, TODAY, None],
             [
                 "Confirmed",
-                timezone.now().date(),
-                timezone.now().date() + timedelta(days=1),
+                TODAY,
+                TODAY + timedelta(days=1),
                 (0, 100.0),
             ],
         ],
     )
     def test_weeks_to_deadline(self, status, start_date, end_date, output):
         """Test the weeks_to_deadline method."""
-        from main import models
-
         project = models.Project(
             name="ProCAT", status=status, start_date=start_date, end_date=end_date
         )
         assert project.weeks_to_deadline == output
 
     @pytest.mark.django_db
-    @pytest.mark.usefixtures("department", "user", "analysis_code")
-    def test_total_effort(self):
+    def test_total_effort(
+        self, user, department, analysis_code, django_assert_num_queries
+    ):
         """Test the total_effort method."""
-        from main import models
-
-        department = models.Department.objects.get(name="ICT")
-        user = models.User.objects.get(username="testuser")
         project = models.Project.objects.create(
             name="ProCAT",
             department=department,
@@ -162,31 +156,35 @@ class TestProject:
         )
         assert project.total_effort is None
 
-        analysis_code = models.AnalysisCode.objects.get(code="1234")
-        funding_A = models.Funding.objects.create(
-            project=project,
-            source="External",
-            cost_centre="centre",
-            activity="G12345",
-            analysis_code=analysis_code,
-            budget=10000.00,
-        )
-        funding_B = models.Funding.objects.create(
-            project=project,
-            source="External",
-            cost_centre="centre",
-            activity="G56789",
-            analysis_code=analysis_code,
-            budget=5000.00,
+        funding_A, funding_B = models.Funding.objects.bulk_create(
+            [
+                models.Funding(
+                    project=project,
+                    source="External",
+                    cost_centre="centre",
+                    activity="G12345",
+                    analysis_code=analysis_code,
+                    budget=10000.00,
+                ),
+                models.Funding(
+                    project=project,
+                    source="External",
+                    cost_centre="centre",
+                    activity="G56789",
+                    analysis_code=analysis_code,
+                    budget=5000.00,
+                ),
+            ]
         )
         total_effort = funding_A.effort + funding_B.effort
-        assert project.total_effort == total_effort
+        with django_assert_num_queries(1):
+            assert project.total_effort == total_effort
 
     @pytest.mark.django_db
-    def test_total_funding_left(self, project, analysis_code):
+    def test_total_funding_left(
+        self, project, analysis_code, today, django_assert_num_queries
+    ):
         """Test the total_funding_left method."""
-        from main import models
-
         # Check when there is no Funding object
         assert project.total_funding_left is None
 
@@ -198,43 +196,42 @@ class TestProject:
             cost_centre="centre",
             activity="G12345",
             analysis_code=analysis_code,
-            expiry_date=timezone.now().date() + timedelta(days=42),
+            expiry_date=today + timedelta(days=42),
             budget=1000.00,
             daily_rate=200.00,
         )
-        monthly_charge_A = models.MonthlyCharge.objects.create(
-            date=timezone.now().date(),
-            project=project,
-            funding=funding,
-            amount=100.00,
-            status="Confirmed",
-        )
-        monthly_charge_B = models.MonthlyCharge.objects.create(
-            date=timezone.now().date(),
-            project=project,
-            funding=funding,
-            amount=200.00,
-            status="Confirmed",
-        )
-        models.MonthlyCharge.objects.create(
-            date=timezone.now().date(),
-            project=project,
-            funding=funding,
-            amount=300.00,
-            status="Draft",  # not counted
+        monthly_charge_A, monthly_charge_B, _ = (
+            models.MonthlyCharge.objects.bulk_create(
+                [
+                    models.MonthlyCharge(
+                        date=today,
+                        project=project,
+                        funding=funding,
+                        amount=amount,
+                        status=status,
+                    )
+                    for amount, status in [
+                        (100.00, "Confirmed"),
+                        (200.00, "Confirmed"),
+                        (300.00, "Draft"),  # not counted
+                    ]
+                ]
+            )
         )
 
         expected_funding_left = (
             funding.budget - monthly_charge_A.amount - monthly_charge_B.amount
         )
 
-        assert project.total_funding_left == expected_funding_left
+        # One query for the funding sources and one for the charges of each
+        with django_assert_num_queries(2):
+            assert project.total_funding_left == expected_funding_left
 
     @pytest.mark.django_db
-    def test_percent_effort_left(self, project, analysis_code):
+    def test_percent_effort_left(
+        self, project, analysis_code, today, django_assert_num_queries
+    ):
         """Test the percent_effort_left method."""
-        from main import models
-
         # Check when there is no Funding object
         assert project.percent_effort_left is None
 
@@ -246,25 +243,26 @@ class TestProject:
             cost_centre="centre",
             activity="G12345",
             analysis_code=analysis_code,
-            expiry_date=timezone.now().date() + timedelta(days=42),
+            expiry_date=today + timedelta(days=42),
             budget=1000.00,
             daily_rate=200.00,
         )
         models.MonthlyCharge.objects.create(
-            date=timezone.now().date(),
+            date=today,
             project=project,
             funding=funding,
             amount=100.00,
         )
-        assert project.days_left[1] == project.percent_effort_left
+        days_left = project.days_left
+        with django_assert_num_queries(2):
+            assert days_left[1] == project.percent_effort_left
 
     @pytest.mark.django_db
-    def test_days_left(self, user, department, analysis_code):
+    def test_days_left(
+        self, user, department, analysis_code, today, django_assert_num_queries
+    ):
         """Test the days_left method."""
-        from main import models
-
         # Get start and end date as 1st last month-1st current month
-        today = timezone.now().date()
         end_date = today.replace(day=1)
         start_date = (end_date - timedelta(days=1)).replace(day=1)
         start_time = datetime.combine(start_date, datetime.min.time())
@@ -289,34 +287,42 @@ class TestProject:
             cost_centre="centre",
             activity="G12345",
             analysis_code=analysis_code,
-            budget=10000.00,
-            daily_rate=50.00,
+            budget=Decimal("10000.00"),
+            daily_rate=Decimal("50.00"),
             expiry_date=end_date,
         )  # 200 days total
-        funding.refresh_from_db()
 
         # Check days_left when there are no time entries
         assert project.days_left == (200, 100)
 
         # Create some time entries
-        models.TimeEntry.objects.create(
-            user=user,
-            project=project,
-            start_time=start_time,
-            end_time=start_time + timedelta(hours=3.5),
-        )  # 3.5 hours total (0.5 days)
-
-        models.TimeEntry.objects.create(
-            user=user,
-            project=project,
-            start_time=start_time,
-            end_time=start_time + timedelta(hours=14),
-        )  # 14 hours total (2 days)
+        models.TimeEntry.objects.bulk_create(
+            [
+                models.TimeEntry(
+                    user=user,
+                    project=project,
+                    start_time=start_time,
+                    end_time=start_time + timedelta(hours=3.5),
+                ),  # 3.5 hours total (0.5 days)
+                models.TimeEntry(
+                    user=user,
+                    project=project,
+                    start_time=start_time,
+                    end_time=start_time + timedelta(hours=14),
+                ),  # 14 hours total (2 days)
+            ]
+        )
 
         # Check days_left has been updated
         left = funding.effort - 2.5
         days_left = round(left, 1), round(left / project.total_effort * 100, 1)
-        assert project.days_left == days_left
+        with django_assert_num_queries(2):
+            assert project.days_left == days_left
+
+        # Only the funding is queried if the time logged was annotated
+        annotated = models.Project.objects.with_time_logged().get(pk=project.pk)
+        with django_assert_num_queries(1):
+            assert annotated.days_left == days_left
 
     @pytest.mark.parametrize(
         ["status", "start_date", "end_date", "output"],
@@ -330,42 +336,29 @@ class TestProject:
             ],
         ],
     )
-    def test_total_working_days(
-        self, user, department, project, status, start_date, end_date, output
-    ):
+    def test_total_working_days(self, status, start_date, end_date, output):
         """Test calculation of total working days for projects."""
-        from main import models
-
-        project = models.Project.objects.create(
-            name="Project",
-            department=department,
-            lead=user,
-            status=status,
-            start_date=start_date,
-            end_date=end_date,
+        project = models.Project(
+            name="Project", status=status, start_date=start_date, end_date=end_date
         )
 
         assert project.total_working_days == output
 
     @pytest.mark.django_db
-    @pytest.mark.usefixtures("department", "user", "analysis_code")
-    def test_effort_per_day(self):
+    def test_effort_per_day(
+        self, user, department, analysis_code, today, django_assert_num_queries
+    ):
         """Test calculation of effort per day."""
-        from main import models
-
-        department = models.Department.objects.get(name="ICT")
-        user = models.User.objects.get(username="testuser")
         project = models.Project.objects.create(
             name="ProCAT",
             department=department,
             lead=user,
             status="Active",
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date() + timedelta(7),
+            start_date=today,
+            end_date=today + timedelta(7),
         )
         assert project.effort_per_day is None
 
-        analysis_code = models.AnalysisCode.objects.get(code="1234")
         funding = models.Funding.objects.create(
             project=project,
             source="External",
@@ -377,13 +370,12 @@ class TestProject:
         )
         total_effort = funding.budget / funding.daily_rate
         effort_per_day = total_effort / project.total_working_days
-        assert project.effort_per_day == effort_per_day
+        with django_assert_num_queries(1):
+            assert project.effort_per_day == effort_per_day
 
     @pytest.mark.django_db
     def test_fte(self, project):
         """Test the fte method."""
-        from main import models
-
         assert (project.fte() == 0).all()
 
         models.ProjectPhase.objects.create(
@@ -420,8 +412,6 @@ class TestProject:
     @pytest.mark.django_db
     def test_no_excess_returns_zero_series(self, project_mid):
         """When days_left <= expected_left across phases, excess FTE should be zero."""
-        from main import models
-
         timerange = make_timerange(
             start_date=project_mid.start_date, end_date=project_mid.end_date
         )
@@ -448,8 +438,6 @@ class TestProject:
     @pytest.mark.django_db
     def test_excess_returns_positive_fte_from_today_to_end_date(self, project_mid):
         """When days_left > expected_left, a positive FTE is set from now to end."""
-        from main import models
-
         timerange = make_timerange(
             start_date=project_mid.start_date, end_date=project_mid.end_date
         )
@@ -494,8 +482,6 @@ class TestFunding:
 
     def test_model_str(self):
         """Test the object string for the funding model."""
-        from main import models
-
         project = models.Project(name="ProCAT")
         funding = models.Funding(
             project=project, budget=10000.00, cost_centre="centre", activity="G12345"
@@ -504,8 +490,6 @@ class TestFunding:
 
     def test_project_code(self):
         """Test project code generated from cost centre and activity."""
-        from main import models
-
         funding = models.Funding()
         assert funding.project_code == "None"
 
@@ -514,45 +498,40 @@ class TestFunding:
 
     def test_effort(self):
         """Test effort calculated from budget and daily rate."""
-        from main import models
-
         funding = models.Funding(budget=10000.00, daily_rate=389.00)
         assert funding.effort == 25.7
 
     def test_is_complete_when_internal(self):
         """Test the is_complete method."""
-        from main import models
-
         funding = models.Funding(source="Internal")
         assert funding.is_complete()
 
-    def test_is_complete_when_external(self):
+    @pytest.mark.parametrize(
+        ["fields", "complete"],
+        [
+            pytest.param({}, False, id="Missing fields"),
+            pytest.param(
+                dict(
+                    funding_body="EPSRC",
+                    cost_centre="centre",
+                    activity="G12345",
+                    analysis_code=models.AnalysisCode(
+                        code="1234", description="Some code", notes="None"
+                    ),
+                    expiry_date=TODAY,
+                ),
+                True,
+                id="All fields present",
+            ),
+        ],
+    )
+    def test_is_complete_when_external(self, fields, complete):
         """Test the is_complete method."""
-        from main import models
-
-        # test with missing fields
-        funding = models.Funding(source="External")
-        assert not funding.is_complete()
-
-        # all fields present
-        analysis_code = models.AnalysisCode(
-            code="1234", description="Some code", notes="None"
-        )
-
-        funding = models.Funding(
-            source="External",
-            funding_body="EPSRC",
-            cost_centre="centre",
-            activity="G12345",
-            analysis_code=analysis_code,
-            expiry_date=timezone.now().date(),
-        )
-        funding.is_complete()
+        funding = models.Funding(source="External", **fields)
+        assert funding.is_complete() is complete
 
     def test_clean(self):
         """Test the clean method."""
-        from main import models
-
         # All good, as the project is Tentative
         project = models.Project(name="ProCAT")
         funding = models.Funding(
@@ -578,141 +557,62 @@ class TestFunding:
             ["G12345", does_not_raise()],
         ],
     )
-    def test_clean_activity(self, activity, expectation, project, analysis_code):
+    def test_clean_activity(self, activity, expectation, make_funding):
         """Test the clean method for validation of the activity code."""
-        from main import models
-
-        funding = models.Funding(
-            project=project,
-            source="External",
-            funding_body="EPSRC",
-            cost_centre="centre",
-            activity=activity,
-            analysis_code=analysis_code,
-            expiry_date=timezone.now().date(),
-            budget=38900.00,
-            daily_rate=389.00,
-        )
+        funding = make_funding(activity=activity)
         with expectation:
             funding.clean()
 
     @pytest.mark.parametrize(
-        ["budget", "expectation"],
+        ["field", "value", "expectation"],
         [
-            [-1000.00, pytest.raises(ValidationError)],
-            [0.00, does_not_raise()],
-            [1000.00, does_not_raise()],
+            ["budget", -1000.00, pytest.raises(ValidationError)],
+            ["budget", 0.00, does_not_raise()],
+            ["budget", 1000.00, does_not_raise()],
+            ["daily_rate", -389.00, pytest.raises(ValidationError)],
+            ["daily_rate", 0.00, does_not_raise()],
+            ["daily_rate", 389.00, does_not_raise()],
         ],
     )
-    def test_budget(self, project, analysis_code, budget, expectation):
-        """Test that the budget cannot be a negative value."""
-        from main import models
-
-        funding = models.Funding.objects.create(
-            project=project,
-            source="External",
-            funding_body="EPSRC",
-            cost_centre="centre",
-            activity="G12345",
-            analysis_code=analysis_code,
-            expiry_date=timezone.now().date(),
-            budget=budget,
-            daily_rate=389.00,
-        )
+    def test_non_negative_amounts(self, make_funding, field, value, expectation):
+        """Test that the budget and daily rate cannot be negative values."""
+        funding = make_funding(**{field: value})
         with expectation:
             funding.full_clean()
 
-    @pytest.mark.parametrize(
-        ["daily_rate", "expectation"],
-        [
-            [-389.00, pytest.raises(ValidationError)],
-            [0.00, does_not_raise()],
-            [389.00, does_not_raise()],
-        ],
-    )
-    def test_daily_rate(self, project, analysis_code, daily_rate, expectation):
-        """Test that the daily rate cannot be a negative value."""
-        from main import models
-
-        funding = models.Funding(
-            project=project,
-            source="External",
-            funding_body="EPSRC",
-            cost_centre="centre",
-            activity="G12345",
-            analysis_code=analysis_code,
-            expiry_date=timezone.now().date(),
-            budget=1000.00,
-            daily_rate=daily_rate,
-        )
-        with expectation:
-            funding.full_clean()
+    @pytest.mark.django_db
+    def test_left_without_charges(self, funding):
+        """Test the funding and effort left when there are no monthly charges."""
+        assert funding.funding_left == funding.budget
+        assert funding.effort_left == funding.effort
 
     @pytest.mark.django_db
-    def test_funding_left(self, project, funding):
+    def test_funding_left(self, funding, confirmed_charge, django_assert_num_queries):
         """Test the funding_left property."""
-        from main import models
+        with django_assert_num_queries(1):
+            assert funding.funding_left == funding.budget - confirmed_charge.amount
 
-        # No monthly charges
-        funding.refresh_from_db()
-        assert funding.funding_left == funding.budget
-
-        # Check when monthly charge created
-        charge_date = funding.expiry_date - timedelta(days=5)
-        monthly_charge = models.MonthlyCharge.objects.create(
-            project=project,
-            funding=funding,
-            amount=100.00,
-            date=charge_date,
-            status="Confirmed",
-        )
-        # Create Draft monthly charge (should not be counted)
-        models.MonthlyCharge.objects.create(
-            project=project,
-            funding=funding,
-            amount=200.00,
-            date=charge_date,
-            status="Draft",
-        )
-        monthly_charge.refresh_from_db()
-        assert funding.funding_left == funding.budget - monthly_charge.amount
+    @pytest.mark.django_db
+    def test_funding_left_with_funding_spent(
+        self, funding, confirmed_charge, django_assert_num_queries
+    ):
+        """Test funding_left uses the total annotated by the queryset."""
+        annotated = models.Funding.objects.with_funding_spent().get(pk=funding.pk)
+        with django_assert_num_queries(0):
+            assert annotated.funding_left == funding.budget - confirmed_charge.amount
 
-    def test_effort_left(self, project, funding):
+    @pytest.mark.django_db
+    def test_effort_left(self, funding, confirmed_charge, django_assert_num_queries):
         """Test the effort_left property."""
-        from main import models
-
-        # No monthly charges
-        funding.refresh_from_db()
-        assert funding.effort_left == funding.effort
-
-        # Check when monthly charge created
-        charge_date = funding.expiry_date - timedelta(days=5)
-        monthly_charge = models.MonthlyCharge.objects.create(
-            project=project,
-            funding=funding,
-            amount=100.00,
-            date=charge_date,
-            status="Confirmed",
-        )
-        # Create Draft monthly charge (should not be counted)
-        models.MonthlyCharge.objects.create(
-            project=project,
-            funding=funding,
-            amount=200.00,
-            date=charge_date,
-            status="Draft",
-        )
-        monthly_charge.refresh_from_db()
         effort_left = float(
-            (funding.budget - monthly_charge.amount) / funding.daily_rate
+            (funding.budget - confirmed_charge.amount) / funding.daily_rate
         )
-        assert funding.effort_left == round(effort_left, 1)
+        with django_assert_num_queries(1):
+            assert funding.effort_left == round(effort_left, 1)
 
     @pytest.mark.django_db
     def test_monthly_pro_rata_charge_is_none(self, user, department, analysis_code):
         """Test the monthly_pro_rata_charge property."""
-        from main import models
-
         project = models.Project.objects.create(
             name="Invalid project",
             department=department,
@@ -730,12 +630,12 @@ class TestFunding:
         assert funding.monthly_pro_rata_charge(date(2025, 3, 15)) is None
 
     @pytest.mark.django_db
-    def test_monthly_pro_rata_charge(self, user, department, analysis_code):
+    def test_monthly_pro_rata_charge(
+        self, user, department, analysis_code, django_assert_num_queries
+    ):
         """Test the monthly_pro_rata_charge property."""
         start_date = date(2025, 3, 15)
         end_date = date(2025, 7, 8)  # 4 equal monthly charges will be created
-        from main import models
-
         project = models.Project.objects.create(
             name="Invalid project",
             department=department,
@@ -753,25 +653,19 @@ class TestFunding:
             budget=10000.00,
         )
         expected_charge = funding.budget / 4
-        assert funding.monthly_pro_rata_charge(start_date) == expected_charge
-        # Last month is not charged, so the charge is None
-        assert funding.monthly_pro_rata_charge(end_date) is None
+        with django_assert_num_queries(0):
+            assert funding.monthly_pro_rata_charge(start_date) == expected_charge
+            # Last month is not charged, so the charge is None
+            assert funding.monthly_pro_rata_charge(end_date) is None
 
 
 class TestCapacity:
     """Tests for the capacity model."""
 
-    def test_model_str(self, user):
+    def test_model_str(self, user, today):
         """Test the object string for the capacity model."""
-        from main import models
-
-        capacity = models.Capacity(
-            user=user, value=0.5, start_date=timezone.now().date()
-        )
-        assert (
-            str(capacity)
-            == f"From {timezone.now().date()}, the capacity of {user!s} is 0.5."
-        )
+        capacity = models.Capacity(user=user, value=0.5, start_date=today)
+        assert str(capacity) == f"From {today}, the capacity of {user!s} is 0.5."
 
     @pytest.mark.parametrize(
         ["value", "expectation"],
@@ -783,13 +677,9 @@ class TestCapacity:
             [1.5, pytest.raises(ValidationError)],
         ],
     )
-    def test_value(self, user, value, expectation):
+    def test_value(self, user, value, expectation, today):
         """Test that the value of capacity can only between 0 and 1."""
-        from main import models
-
-        capacity = models.Capacity(
-            user=user, value=value, start_date=timezone.now().date()
-        )
+        capacity = models.Capacity(user=user, value=value, start_date=today)
         with expectation:
             capacity.full_clean()
 
@@ -799,13 +689,12 @@ class TestTimeEntry:
 
     def test_model_str(self, user, project):
         """Test the object string for the time entry model."""
-        from main import models
-
+        now = timezone.now()
         time_entry = models.TimeEntry(
             user=user,
             project=project,
-            start_time=timezone.now(),
-            end_time=timezone.now() + timedelta(hours=7.5),
+            start_time=now,
+            end_time=now + timedelta(hours=7.5),
         )
         assert (
             str(time_entry)
@@ -816,17 +705,15 @@ class TestTimeEntry:
 class TestMonthlyCharge:
     """Tests for the monthly charge model."""
 
-    def test_model_str(self, project, funding):
+    def test_model_str(self, project, funding, today):
         """Test the object string for the monthly charge model."""
-        from main import models
-
         monthly_charge = models.MonthlyCharge(
-            project=project, funding=funding, amount=500.00, date=timezone.now().date()
+            project=project, funding=funding, amount=500.00, date=today
         )
         monthly_charge.clean()
         assert str(monthly_charge) == (
             f"RSE Project {project} ({funding.cost_centre}_{funding.activity}): "
-            f"{timezone.now().month}/{timezone.now().year} [rcs-manager@imperial.ac.uk]"
+            f"{today.month}/{today.year} [rcs-manager@imperial.ac.uk]"
         )
 
         monthly_charge = models.MonthlyCharge(
@@ -842,54 +729,27 @@ class TestMonthlyCharge:
             [1.00, does_not_raise()],
         ],
     )
-    def test_amount(self, project, funding, amount, expectation):
+    def test_amount(self, project, funding, amount, expectation, today):
         """Test that the amount must be non-negative."""
-        from main import models
-
         monthly_charge = models.MonthlyCharge(
-            project=project, funding=funding, amount=amount, date=timezone.now().date()
+            project=project, funding=funding, amount=amount, date=today
         )
         with expectation:
             monthly_charge.full_clean()
 
-    @pytest.mark.usefixtures("project")
-    def test_clean_missing_funding_fields(self, project):
+    def test_clean_missing_funding_fields(self, project, today):
         """Test the model validation for the funding fields."""
-        from main import models
-
         funding = models.Funding(cost_centre="centre", activity="G12345")
         monthly_charge = models.MonthlyCharge(
-            project=project, funding=funding, amount=10, date=timezone.now().date()
-        )
-        with pytest.raises(
-            ValidationError,
-            match=r"Funding source must have an expiry date.",
-        ):
-            monthly_charge.clean()
-
-    @pytest.mark.usefixtures("project", "funding")
-    def test_clean_invalid_date(self, project, funding):
-        """Test the model validation for the date field."""
-        from main import models
-
-        monthly_charge = models.MonthlyCharge(
-            project=project,
-            funding=funding,
-            date=funding.expiry_date + timedelta(1),  # invalid date
-            amount=funding.funding_left - 1,
+            project=project, funding=funding, amount=10, date=today
         )
-
-        with pytest.raises(
-            ValidationError,
-            match=r"Monthly charge must not exceed the funding date or amount.",
-        ):
+        with pytest.raises(ValidationError) as e:
             monthly_charge.clean()
+        assert e.value.messages == ["Funding source must have an expiry date."]
 
     @pytest.mark.django_db
     def test_clean_invalid_funding(self, project, funding):
         """Test the model validation for the amount field."""
-        from main import models
-
         monthly_charge = models.MonthlyCharge.objects.create(
             project=project,
             funding=funding,
@@ -897,56 +757,55 @@ class TestMonthlyCharge:
             amount=funding.funding_left + 1,  # Invalid funding
             status="Confirmed",
         )
-        funding.refresh_from_db()  # Update funding object
 
-        with pytest.raises(
-            ValidationError,
-            match=r"Monthly charge must not exceed the funding date or amount.",
-        ):
+        with pytest.raises(ValidationError) as e:
             monthly_charge.clean()
+        assert e.value.messages == [
+            "Monthly charge must not exceed the funding date or amount."
+        ]
 
-    @pytest.mark.usefixtures("funding")
-    def test_clean_invalid_description(self, funding):
-        """Test the model validation for the missing description field."""
-        from main import models
-
+    @pytest.mark.parametrize(
+        ["days_to_expiry", "description", "messages"],
+        [
+            pytest.param(
+                -1,
+                "A custom description.",
+                ["Monthly charge must not exceed the funding date or amount."],
+                id="Invalid date",
+            ),
+            pytest.param(
+                1,
+                "",
+                ["Line description needed for manual charging method."],
+                id="Missing description",
+            ),
+            pytest.param(1, "A custom description.", [], id="Valid"),
+        ],
+    )
+    def test_clean_manual_charge(self, funding, days_to_expiry, description, messages):
+        """Test the model validation of the date and description of manual charges."""
         project = models.Project(name="Project", charging="Manual")
         monthly_charge = models.MonthlyCharge(
             project=project,
             funding=funding,
             amount=funding.funding_left - 1,
-            date=funding.expiry_date - timedelta(1),
+            date=funding.expiry_date - timedelta(days_to_expiry),
+            description=description,
         )
 
-        with pytest.raises(
-            ValidationError,
-            match=r"Line description needed for manual charging method.",
-        ):
+        if messages:
+            with pytest.raises(ValidationError) as e:
+                monthly_charge.clean()
+            assert e.value.messages == messages
+        else:
             monthly_charge.clean()
 
-    @pytest.mark.usefixtures("funding")
-    def test_clean_valid(self, project, funding):
-        """Test the model validation for valid amount, date and description fields."""
-        from main import models
-
-        project = models.Project(name="Project", charging="Manual")
-        monthly_charge = models.MonthlyCharge(
-            project=project,
-            funding=funding,
-            amount=funding.funding_left - 1,
-            date=funding.expiry_date - timedelta(1),
-            description="A custom description.",
-        )
-        monthly_charge.clean()
-
 
 class TestProjectPhase:
     """Tests for the Project Phase model."""
 
     def test_trace(self) -> None:
         """Test the trace method."""
-        from main import models
-
         start_date = datetime(2025, 1, 1).date()
         end_date = datetime(2025, 1, 3).date()
         project_phase = models.ProjectPhase(
@@ -966,8 +825,6 @@ class TestProjectPhase:
 
     def test_model_str(self, project_static):
         """Test the object string for the monthly charge model."""
-        from main import models
-
         project_phase = models.ProjectPhase(
             project=project_static,
             value=1,
@@ -1022,8 +879,6 @@ class TestProjectPhase:
         self, project_static, days, start_date, end_date, value, validation_error
     ):
         """Test the from_days function and that value is calculated correctly."""
-        from main import models
-
         if validation_error is not None:
             with pytest.raises(ValidationError, match=validation_error):
                 models.ProjectPhase.from_days(
@@ -1104,8 +959,6 @@ class TestProjectPhase:
         message,
     ):
         """Test the check_phase_in_project method."""
-        from main import models
-
         phase = models.ProjectPhase(
             project=project_static,
             value=value,
@@ -1181,8 +1034,6 @@ class TestProjectPhase:
         message,
     ):
         """Test the check_overlapping_phases method."""
-        from main import models
-
         phase = models.ProjectPhase(
             project=project_static,
             value=value,
@@ -1250,8 +1101,6 @@ class TestProjectPhase:
         message,
     ):
         """Test the check_phase_alignment method."""
-        from main import models
-
         phase = models.ProjectPhase(
             project=project_static,
             value=value,
@@ -1263,22 +1112,20 @@ class TestProjectPhase:
             phase.check_phase_alignment()
         assert message is None or message in str(e)
 
-    def test_check_project_funding(self, project):
+    def test_check_project_funding(self, project, today):
         """Test the check_project_funding method."""
-        from main import models
-
         phase = models.ProjectPhase(
             project=project,
             value=1,
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date() + timedelta(days=12),
+            start_date=today,
+            end_date=today + timedelta(days=12),
         )
 
-        with pytest.raises(
-            ValidationError,
-            match=r"Project must have associated funding before phases can be added.",
-        ):
+        with pytest.raises(ValidationError) as e:
             phase.check_project_funding()
+        assert e.value.messages == [
+            "Project must have associated funding before phases can be added."
+        ]
 
     @pytest.mark.parametrize(
         "value,start_date,end_date,validation_error,message",
@@ -1312,8 +1159,6 @@ class TestProjectPhase:
         message,
     ):
         """Test the clean method."""
-        from main import models
-
         phase = models.ProjectPhase(
             project=project_static,
             value=value,
@@ -1327,8 +1172,6 @@ class TestProjectPhase:
 
     def test_before_phase_returns_total_days(self, project_static):
         """When today is before the start date, all days should remain."""
-        from main import models
-
         today = timezone.now()
         phase = models.ProjectPhase(
             project=project_static,
@@ -1341,8 +1184,6 @@ class TestProjectPhase:
 
     def test_after_phase_returns_zero(self, project_static):
         """When today is after the end date, no days should remain."""
-        from main import models
-
         today = timezone.now()
         phase = models.ProjectPhase(
             project=project_static,
@@ -1355,8 +1196,6 @@ class TestProjectPhase:
 
     def test_midpoint_of_phase_returns_half_days(self, project_static):
         """When today is exactly halfway through, half the days should remain."""
-        from main import models
-
         today = timezone.now()
         phase = models.ProjectPhase(
             project=project_static,
@@ -538,6 +538,7 @@ def test_create_charges_report_for_download(department, user, analysis_code):
     assert response.status_code == HTTPStatus.OK
     assert response["Content-Type"] == "text/csv"
     assert expected_fname in response["Content-Disposition"]
+    content = b"".join(response.streaming_content).decode("utf-8")
 
     # Check the pro-rata charge row is in the CSV as expected
     expected_pro_rata_charge_row = ",".join(
@@ -552,7 +553,7 @@ def test_create_charges_report_for_download(department, user, analysis_code):
             ),
         ]
     )
-    assert expected_pro_rata_charge_row in response.content.decode("utf-8")
+    assert expected_pro_rata_charge_row in content
 
     # Check the actual charge row is in the CSV is as expected
     n_days = 0.5
@@ -568,7 +569,7 @@ def test_create_charges_report_for_download(department, user, analysis_code):
             ),
         ]
     )
-    assert expected_actual_charge_row in response.content.decode("utf-8")
+    assert expected_actual_charge_row in content
 
 
 @pytest.mark.django_db
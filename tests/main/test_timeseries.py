@@ -165,6 +165,17 @@ def test_get_effort_timeseries_status_filter(
     ts = timeseries.get_effort_timeseries(start_date, end_date, ["Tentative"])
     assert ts.iloc[0] == tentative_project.fte().iloc[0]
 
+    # Check several groups of statuses aggregated at once match the filters
+    groups = [["Tentative", "Active"], ["Active"], ["Confirmed"]]
+    efforts = timeseries.get_effort_timeseries_by_status(start_date, end_date, groups)
+    for group, ts in zip(groups[:2], efforts[:2]):
+        pd.testing.assert_series_equal(
+            ts,
+            timeseries.get_effort_timeseries(start_date, end_date, group),
+            check_freq=False,
+        )
+    assert (efforts[2] == 0).all()
+
 
 @pytest.mark.django_db
 def test_get_team_members_timeseries(user, django_user_model):
@@ -179,30 +190,25 @@ def test_get_team_members_timeseries(user, django_user_model):
         username="testuser2",
     )
 
+    now = timezone.now()
+    today = now.date()
+    models.Capacity.objects.create(user=user, value=0.5, start_date=today)
     models.Capacity.objects.create(
-        user=user, value=0.5, start_date=timezone.now().date()
-    )
-    models.Capacity.objects.create(
-        user=another_user, value=0.7, start_date=timezone.now().date() + timedelta(7)
-    )
-    plot_start_date, plot_end_date = (
-        timezone.now() - timedelta(7),
-        timezone.now() + timedelta(28),
+        user=another_user, value=0.7, start_date=today + timedelta(7)
     )
+    plot_start_date, plot_end_date = now - timedelta(7), now + timedelta(28)
     ts = timeseries.get_team_members_timeseries(plot_start_date, plot_end_date)
     ts_index = ts.index.tz_localize(None)
     assert isinstance(ts, pd.Series)
-    assert all(ts[ts_index < pd.to_datetime(timezone.now().date())] == 0)
+    assert all(ts[ts_index < pd.to_datetime(today)] == 0)
     assert all(
         ts[
-            (pd.to_datetime(timezone.now().date()) <= ts_index)
-            * (ts_index < pd.to_datetime(timezone.now().date() + timedelta(7)))
+            (pd.to_datetime(today) <= ts_index)
+            * (ts_index < pd.to_datetime(today + timedelta(7)))
         ]
         == 1
     )
-    assert all(
-        ts[ts_index >= pd.to_datetime(timezone.now().date() + timedelta(7))] == 2
-    )
+    assert all(ts[ts_index >= pd.to_datetime(today + timedelta(7))] == 2)
 
 
 @pytest.mark.django_db
@@ -210,13 +216,14 @@ def test_get_capacity_timeseries(user):
     """Test the get_capacity_timeseries function."""
     from main import models, timeseries
 
+    now = timezone.now()
     capacity_A = models.Capacity.objects.create(
-        user=user, value=0.5, start_date=timezone.now().date()
+        user=user, value=0.5, start_date=now.date()
     )
     capacity_B = models.Capacity.objects.create(
-        user=user, value=0.7, start_date=timezone.now().date() + timedelta(7)
+        user=user, value=0.7, start_date=now.date() + timedelta(7)
     )
-    plot_start_date, plot_end_date = timezone.now(), timezone.now() + timedelta(28)
+    plot_start_date, plot_end_date = now, now + timedelta(28)
     ts = timeseries.get_capacity_timeseries(plot_start_date, plot_end_date)
     assert isinstance(ts, pd.Series)
     assert ts.value_counts()[capacity_A.value] == 5
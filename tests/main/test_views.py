@@ -14,7 +14,9 @@ from django.test import RequestFactory
 from django.urls import reverse
 from django.utils import timezone
 
-from main.models import Funding, Project, ProjectPhase
+from main.models import Funding, MonthlyCharge, Project, ProjectPhase, TimeEntry
+from main.utils import format_currency
+from procat.settings.settings import TABLE_ROWS_PER_PAGE
 
 from .view_utils import LoginRequiredMixin, PermissionRequiredMixin, TemplateOkMixin
 
@@ -53,6 +55,88 @@ class TestProjectsListView(LoginRequiredMixin, TemplateOkMixin):
         for i, (title, prefix) in enumerate(expected_tables):
             assert tables[i][0] == title
             assert tables[i][1].prefix == prefix
+            assert tables[i][1].paginator.per_page == TABLE_ROWS_PER_PAGE
+
+    @pytest.mark.django_db
+    def test_get_queryset_only_table_fields(self, auth_client, project):
+        """Test that fields not displayed in the tables are not retrieved."""
+        response = auth_client.get(reverse("main:projects"))
+
+        deferred = response.context["project_list"][0].get_deferred_fields()
+        assert {"pi", "notifications_effort", "notifications_weeks"} <= deferred
+        assert "name" not in deferred
+
+    @pytest.mark.django_db
+    def test_projects_queried_once(
+        self, auth_client, user, department, project, django_assert_num_queries
+    ):
+        """Test that all the tables are populated from a single projects query."""
+        Project.objects.create(
+            name="Test Tentative",
+            status="Tentative",
+            department=department,
+            lead=user,
+        )
+
+        # Session, user, projects, funding, and user and group permissions
+        with django_assert_num_queries(6):
+            response = auth_client.get(reverse("main:projects"))
+
+        assert response.status_code == HTTPStatus.OK
+
+    @pytest.mark.django_db
+    def test_projects_ordered_by_database(self, auth_client, user, department):
+        """Test that the projects come ordered by name from the single query."""
+        for name in ("B project", "C project", "A project"):
+            Project.objects.create(
+                name=name, status="Tentative", department=department, lead=user
+            )
+
+        response = auth_client.get(reverse("main:projects"))
+
+        table = dict(response.context["tables"])["Tentative"]
+        assert not table.order_by  # Not sorted again by the table
+        assert [row.record.name for row in table.rows] == [
+            "A project",
+            "B project",
+            "C project",
+        ]
+
+    @pytest.mark.django_db
+    def test_funding_prefetched(
+        self, auth_client, user, department, project, funding, django_assert_num_queries
+    ):
+        """Test that the funding, charges and time of the projects are fetched once."""
+        MonthlyCharge.objects.create(
+            project=project,
+            funding=funding,
+            amount=100.00,
+            date=funding.expiry_date,
+            status="Confirmed",
+        )
+        Project.objects.create(
+            name="Test Tentative",
+            status="Tentative",
+            department=department,
+            lead=user,
+        )
+
+        TimeEntry.objects.create(
+            user=user,
+            project=project,
+            start_time=timezone.now(),
+            end_time=timezone.now() + timedelta(hours=7),
+        )
+
+        # The same queries as without any charges or time entries
+        with django_assert_num_queries(6):
+            response = auth_client.get(reverse("main:projects"))
+
+        assert response.status_code == HTTPStatus.OK
+        row = response.context["tables"][0][1].rows[0]
+        assert row.get_cell_value("total_funding_left") == format_currency(
+            funding.budget - 100
+        )
 
     @pytest.mark.django_db
     def test_filtered_tables(self, auth_client, user, department, project):
@@ -279,6 +363,29 @@ class TestFundingListView(PermissionRequiredMixin, TemplateOkMixin):
             admin_client.get(endpoint, {"sort": "-funding_left"})
             assert order_mock.call_args.args[2]
 
+    @pytest.mark.django_db
+    def test_charges_not_queried_per_row(
+        self, admin_client, project, funding, django_assert_num_queries
+    ):
+        """Test that the funding left is calculated within the funding query."""
+        MonthlyCharge.objects.create(
+            project=project,
+            funding=funding,
+            amount=100.00,
+            date=funding.expiry_date,
+            status="Confirmed",
+        )
+
+        # Session, user, funding count for the paginator and the funding rows
+        with django_assert_num_queries(4):
+            response = admin_client.get(reverse("main:funding"))
+
+        assert response.status_code == HTTPStatus.OK
+        row = response.context["table"].rows[0]
+        assert row.get_cell_value("funding_left") == format_currency(
+            funding.budget - 100
+        )
+
 
 class TestCapacitiesListView(
     PermissionRequiredMixin, LoginRequiredMixin, TemplateOkMixin
@@ -426,6 +533,60 @@ class TestProjectsDetailView(PermissionRequiredMixin, TemplateOkMixin):
             assert form.fields[field].widget.attrs["disabled"]
             assert form.fields[field].widget.attrs["readonly"]
 
+    def test_tables_sorted_independently(self, admin_client, project):
+        """Tests sorting one of the tables leaves the other one unchanged."""
+        endpoint = reverse("main:project_detail", kwargs={"pk": project.pk})
+
+        response = admin_client.get(endpoint, {"phase-sort": "-start_date"})
+        assert response.context["funding_table"].order_by == ("expiry_date",)
+        assert response.context["phase_table"].order_by == ("-start_date",)
+
+    def test_get_object_cached(self, admin_user, project, django_assert_num_queries):
+        """Tests the object is only retrieved from the database once per request."""
+        from main import views
+
+        request = RequestFactory().get(self._get_url())
+        request.user = admin_user
+        view = views.ProjectDetailView()
+        view.setup(request, pk=project.pk)
+
+        with django_assert_num_queries(1):
+            obj = view.get_object()
+            assert view.get_object() is obj
+
+    def test_readonly_form_class_reused(self, admin_client, project):
+        """Tests the read-only form class is built once and not shared with edits."""
+        endpoint = reverse("main:project_detail", kwargs={"pk": project.pk})
+        form = admin_client.get(endpoint).context["form"]
+        assert type(admin_client.get(endpoint).context["form"]) is type(form)
+
+        endpoint = reverse("main:project_update", kwargs={"pk": project.pk})
+        form = admin_client.get(endpoint).context["form"]
+        for field in form.fields.values():
+            assert "readonly" not in field.widget.attrs
+
+    @pytest.mark.parametrize("extra_phases", [0, 1])
+    def test_phase_queries_constant(
+        self,
+        admin_client,
+        project_static,
+        phase,
+        extra_phases,
+        django_assert_num_queries,
+    ):
+        """Tests the number of queries does not grow with the number of phases."""
+        for _ in range(extra_phases):
+            ProjectPhase.objects.create(
+                project=project_static,
+                value=1,
+                start_date=project_static.start_date,
+                end_date=project_static.start_date + timedelta(days=30),
+            )
+
+        endpoint = reverse("main:project_detail", kwargs={"pk": project_static.pk})
+        with django_assert_num_queries(11):
+            admin_client.get(endpoint)
+
 
 @pytest.mark.usefixtures("project", "phase")
 class TestProjectsPhaseDetailView(PermissionRequiredMixin, TemplateOkMixin):
@@ -499,6 +660,23 @@ class TestFundingDetailView(PermissionRequiredMixin, TemplateOkMixin):
             assert form.fields[field].widget.attrs["disabled"]
             assert form.fields[field].widget.attrs["readonly"]
 
+    def test_charges(self, admin_client, project, funding):
+        """Tests the charges table is populated with the charges, latest first."""
+        from main import models
+
+        today = timezone.now().date()
+        for date, amount in ((today, 100), (today.replace(year=today.year - 1), 50)):
+            models.MonthlyCharge.objects.create(
+                date=date, project=project, funding=funding, amount=amount
+            )
+
+        endpoint = reverse("main:funding_detail", kwargs={"pk": funding.pk})
+        response = admin_client.get(endpoint)
+
+        # The charges table is populated from plain rows, latest first
+        table = response.context["monthly_charges_table"]
+        assert [row.get_cell_value("amount") for row in table.rows] == [100, 50]
+
 
 class TestCapacityPlanningView(LoginRequiredMixin, TemplateOkMixin):
     """Test suite for the Capacity Planning view."""
@@ -515,11 +693,58 @@ class TestCapacityPlanningView(LoginRequiredMixin, TemplateOkMixin):
         endpoint = reverse("main:capacity_planning")
         response = auth_client.get(endpoint)
         assert response.status_code == HTTPStatus.OK
-        assert "<script" in response.context["script"]
-        assert "<div" in response.context["div"]
+        assert reverse("main:capacity_planning_plot") in response.content.decode()
         assert response.context["bokeh_version"] == bokeh.__version__
 
 
+class TestCapacityPlanningPlotView(LoginRequiredMixin):
+    """Test suite for the Capacity Planning plot view."""
+
+    def _get_url(self):
+        return reverse("main:capacity_planning_plot")
+
+    def test_get(self, auth_client, funding):
+        """Tests the plots are provided as a Bokeh JSON item."""
+        response = auth_client.get(self._get_url())
+        assert response.status_code == HTTPStatus.OK
+        assert {"target_id", "root_id", "doc"} <= response.json().keys()
+
+    def test_get_not_modified(self, auth_client, funding):
+        """Tests the plots are not created again if the data has not changed."""
+        endpoint = self._get_url()
+        response = auth_client.get(endpoint)
+        assert "private" in response["Cache-Control"]
+        headers = {"if-none-match": response["ETag"]}
+
+        response = auth_client.get(endpoint, headers=headers)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        funding.budget = 20000
+        funding.save()
+        response = auth_client.get(endpoint, headers=headers)
+        assert response.status_code == HTTPStatus.OK
+
+    def test_etag(self, user, capacity, django_assert_num_queries):
+        """Tests the ETag takes one query per table and follows every change."""
+        from main import views
+        from main.models import Capacity
+
+        other = Capacity.objects.create(
+            user=user, value=0.5, start_date=capacity.start_date + timedelta(days=7)
+        )
+        request = RequestFactory().get(self._get_url())
+        with django_assert_num_queries(6):
+            etag = views.plots_etag(request)
+        assert views.plots_etag(request) == etag
+
+        # Changes cancelling each other out still provide a new ETag
+        capacity.value += 0.1
+        capacity.save()
+        other.value -= 0.1
+        other.save()
+        assert views.plots_etag(request) != etag
+
+
 class TestCostRecoveryView(LoginRequiredMixin, TemplateOkMixin):
     """Test suite for the Cost Recovery view."""
 
@@ -535,9 +760,14 @@ class TestCostRecoveryView(LoginRequiredMixin, TemplateOkMixin):
         endpoint = reverse("main:cost_recovery")
         response = auth_client.get(endpoint)
         assert response.status_code == HTTPStatus.OK
-        assert "<script" in response.context["script"]
-        assert "<div" in response.context["div"]
+        assert reverse("main:cost_recovery_plot") not in response.content.decode()
         assert response.context["bokeh_version"] == bokeh.__version__
+        assert not response.context["preview"]
+
+        # The plots are only loaded when previewed
+        response = auth_client.get(endpoint, {"preview": 1})
+        assert reverse("main:cost_recovery_plot") in response.content.decode()
+        assert response.context["preview"]
 
     def test_form_valid(self, user):
         """Tests the form_valid method.
@@ -561,6 +791,19 @@ class TestCostRecoveryView(LoginRequiredMixin, TemplateOkMixin):
         assert f"charges_report_{month}-{year}.csv" in response["Content-Disposition"]
 
 
+class TestCostRecoveryPlotView(LoginRequiredMixin):
+    """Test suite for the Cost Recovery plot view."""
+
+    def _get_url(self):
+        return reverse("main:cost_recovery_plot")
+
+    def test_get(self, auth_client):
+        """Tests the plots are provided as a Bokeh JSON item."""
+        response = auth_client.get(self._get_url())
+        assert response.status_code == HTTPStatus.OK
+        assert {"target_id", "root_id", "doc"} <= response.json().keys()
+
+
 class TestFundingCreateView(PermissionRequiredMixin, TemplateOkMixin):
     """Test suite for the Funding Create view."""
 
@@ -32,10 +32,15 @@ def test_add_timeseries_callback_to_date_pickers():
         args=dict(
             start_picker=start_picker, end_picker=end_picker, x_range=plot.x_range
         ),
-        code="""const start = Date.parse(start_picker.value);
-            const end = Date.parse(end_picker.value);
-            x_range.start = start
-            x_range.end = end""",
+        code="""function toTimestamp(value) {
+                // Picker values are ISO dates, parsed without Date.parse
+                const year = +value.slice(0, 4);
+                const month = value.slice(5, 7) - 1;
+                return Date.UTC(year, month, +value.slice(8, 10));
+            }
+
+            x_range.start = toTimestamp(start_picker.value);
+            x_range.end = toTimestamp(end_picker.value);""",
     )
 
     # Check js_on_change called with the expected arguments
@@ -74,25 +79,20 @@ def test_add_bar_callback_to_date_pickers():
             end_picker=end_picker,
             plot=bar_plot,
             months=chart_months,
+            month_index={date[0].strftime("%Y-%m"): i for i, date in enumerate(dates)},
         ),
-        code="""if (window.skip_bar_picker_callback) {
-            window.skip_bar_picker_callback = false;
+        code="""if (plot.bar_picker_frame) {
             return;
         }
 
-        function getIndex(picker_value) {
-            const date = new Date(picker_value);
-            const month = date.toLocaleString('default', { month: 'short' });
-            const year = date.getFullYear();
-            const formatted_month = `${month} ${year}`;
-            return months.indexOf(formatted_month);
-        }
-
-        const start_index = getIndex(start_picker.value);
-        const end_index = getIndex(end_picker.value);
-        const selected_months = months.slice(start_index, end_index + 1);
+        plot.bar_picker_frame = requestAnimationFrame(() => {
+            plot.bar_picker_frame = null;
+            const start_index = month_index[start_picker.value.slice(0, 7)];
+            const end_index = month_index[end_picker.value.slice(0, 7)];
+            const selected_months = months.slice(start_index, end_index + 1);
 
-        plot.x_range.factors = selected_months;""",
+            plot.x_range.factors = selected_months;
+        });""",
     )
 
     # Check js_on_change called with the expected arguments
@@ -187,8 +187,7 @@ def test_add_bar_callback_to_button():
             else [],
             plot=bar_plot,
         ),
-        code="""window.skip_bar_picker_callback = true;
-            plot.x_range.factors = indexed_months;""",
+        code="""plot.x_range.factors = indexed_months;""",
     )
 
     # Check js_on_click called with the expected arguments